@@ -0,0 +1,39 @@
+"""review_task_comparison_hash
+
+Revision ID: 20261017_0001
+Revises: 20251224_0002
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0001"
+down_revision: Union[str, Sequence[str], None] = "20251224_0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    승인 가드 재검증 생략 판단용 comparison_hash 컬럼 추가
+    """
+    op.add_column(
+        "manual_review_tasks",
+        sa.Column(
+            "comparison_hash",
+            sa.String(length=64),
+            nullable=True,
+            comment="초안 텍스트 + 비교 후보 ID sha256 (승인 가드 재검증 생략 판단용)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """
+    comparison_hash 컬럼 제거
+    """
+    op.drop_column("manual_review_tasks", "comparison_hash")
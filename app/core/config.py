@@ -51,21 +51,46 @@ class Settings(BaseSettings):
     vectorstore_dimension: int = 384  # E5 embedding dimension (was 1536 for OpenAI)
 
     # PGVector specific (when vectorstore_type == "pgvector")
-    pgvector_table_consultation: str = "consultation_vectors"
-    pgvector_table_manual: str = "manual_vectors"
+    # Table names are interpolated into SQL, so only plain identifiers are accepted
+    pgvector_table_consultation: str = Field(
+        default="consultation_vectors",
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+    )
+    pgvector_table_manual: str = Field(
+        default="manual_vectors",
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+    )
+    # FP16 halfvec storage for new tables (pgvector >= 0.7); existing tables keep their type
+    pgvector_use_halfvec: bool = False
+    # ivfflat: faster bulk (re)builds
+    pgvector_index_type: Literal["hnsw", "ivfflat"] = "hnsw"
+    # ivfflat.probes per query (when index type is ivfflat)
+    pgvector_ivfflat_probes: int = 10
+    pgvector_hnsw_m: int = 24  # HNSW graph degree (embedding index)
+    pgvector_hnsw_ef_construction: int = 128  # HNSW build-time candidate list size
+    pgvector_hnsw_maintenance_work_mem: str = "2GB"  # SET LOCAL during index build
+    # SET LOCAL max_parallel_maintenance_workers during index build
+    pgvector_hnsw_parallel_workers: int = 7
+    pgvector_ef_search: int = 100  # Min hnsw.ef_search per query (raised to top_k * 4)
+    # hnsw.max_scan_tuples for filtered (iterative) scans
+    pgvector_max_scan_tuples: int = 20000
 
     # Embedding Service (E5 Model)
     # Unit Spec v1.1: ASYNC SAFETY, E5 USAGE RULES, LIFECYCLE INTEGRATION
     embedding_model: Literal["e5"] = "e5"
     e5_model_name: str = "dragonkue/multilingual-e5-small-ko-v2"
     embedding_device: Literal["cpu", "cuda"] = "cpu"  # GPU if available, otherwise CPU
-    embedding_max_concurrency: int = 4  # Max concurrent embedding operations (threadpool limit)
+    # Max concurrent embedding operations; unset = 1 on CPU (torch already uses all cores per encode), 4 on CUDA
+    embedding_max_concurrency: int | None = None
+    # In-process LRU entries for query/passage embeddings (0 disables)
+    embedding_cache_size: int = 10000
 
     # LLM Configuration
     llm_provider: Literal["openai", "anthropic", "mock", "ollama"] = "mock"
     llm_model: str = "gpt-4-turbo-preview"
     llm_temperature: float = 0.3
     llm_max_tokens: int = 2000
+    llm_summary_timeout_seconds: float = 10.0  # diff 요약 LLM 호출 타임아웃 (초)
 
     # Ollama
     ollama_base_url: str = "http://localhost:11434"
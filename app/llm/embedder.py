@@ -15,8 +15,11 @@ Corrections Applied (2025-12-18):
 from __future__ import annotations
 
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Optional
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from app.core.config import settings
@@ -25,6 +28,9 @@ from app.core.exceptions import VectorIndexError
 
 logger = get_logger(__name__)
 
+# SentenceTransformer.encode() batch size for embed_passages()
+_PASSAGE_BATCH_SIZE = 32
+
 
 class EmbeddingService:
     """
@@ -62,7 +68,9 @@ class EmbeddingService:
 
         self.model_name = settings.e5_model_name
         self.device = settings.embedding_device
-        self.max_concurrency = settings.embedding_max_concurrency
+        self.max_concurrency = _resolve_max_concurrency(
+            settings.embedding_max_concurrency, self.device
+        )
         self.model: Optional[SentenceTransformer] = None
         self._initialized: bool = False
         self._load_lock = asyncio.Lock()
@@ -71,6 +79,13 @@ class EmbeddingService:
         # Prevents threadpool flooding under high load
         self._semaphore: Optional[asyncio.Semaphore] = None
 
+        # LRU cache of embeddings keyed by hash of the prefixed text
+        # (repeated queries and unchanged re-indexed passages skip the model).
+        # Stored as float32 arrays (~1.5KB per 384-dim vector instead of
+        # ~12KB as a list of Python floats); converted to lists on return.
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._embedding_cache_size = settings.embedding_cache_size
+
         logger.info(
             "embedding_service_created",
             model_name=self.model_name,
@@ -186,7 +201,7 @@ class EmbeddingService:
         await self._ensure_initialized()
         try:
             prefixed_text = f"query: {text}"
-            embedding = await self._encode_async(prefixed_text)
+            embedding = await self._encode_cached(prefixed_text)
             logger.debug(
                 "query_embedded",
                 text_length=len(text),
@@ -213,7 +228,7 @@ class EmbeddingService:
         await self._ensure_initialized()
         try:
             prefixed_text = f"passage: {text}"
-            embedding = await self._encode_async(prefixed_text)
+            embedding = await self._encode_cached(prefixed_text)
             logger.debug(
                 "passage_embedded",
                 text_length=len(text),
@@ -224,6 +239,52 @@ class EmbeddingService:
             logger.error("passage_embedding_failed", error=str(e), text_length=len(text))
             raise VectorIndexError(f"Failed to embed passage: {e}")
 
+    async def embed_passages(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed multiple document passages in one batched encode call.
+
+        Same "passage:" prefix as embed_passage(), but the model's fixed
+        per-call cost (tokenizer, dispatch) is paid once per batch.
+
+        Args:
+            texts: Document texts to embed
+
+        Returns:
+            Embedding vectors in input order
+
+        Raises:
+            VectorIndexError: If embedding fails
+        """
+        if not texts:
+            return []
+
+        await self._ensure_initialized()
+        try:
+            keys = [_cache_key(f"passage: {text}") for text in texts]
+            cached: list[list[float] | None] = []
+            for key in keys:
+                hit = self._cache_get(key)
+                cached.append(None if hit is None else hit.tolist())
+            misses = [i for i, embedding in enumerate(cached) if embedding is None]
+            if misses:
+                encoded = await self._encode_batch_async(
+                    [f"passage: {texts[i]}" for i in misses]
+                )
+                for i, embedding in zip(misses, encoded):
+                    self._cache_put(keys[i], embedding)
+                    cached[i] = embedding
+            embeddings = [embedding for embedding in cached if embedding is not None]
+            assert len(embeddings) == len(texts)
+            logger.debug(
+                "passages_embedded",
+                count=len(embeddings),
+                embedding_dim=len(embeddings[0]),
+            )
+            return embeddings
+        except Exception as e:
+            logger.error("passage_batch_embedding_failed", error=str(e), count=len(texts))
+            raise VectorIndexError(f"Failed to embed passages: {e}")
+
     async def similarity_query_passage(self, query_text: str, passage_text: str) -> float:
         """
         Calculate cosine similarity between query and passage with E5 prefixes.
@@ -292,6 +353,30 @@ class EmbeddingService:
         logger.warning("embedding_service_lazy_initialization")
         await self.warmup()
 
+    async def _encode_cached(self, text: str) -> list[float]:
+        """Encode text through the LRU cache (returns a fresh list per call)."""
+        key = _cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached.tolist()
+        embedding = await self._encode_async(text)
+        self._cache_put(key, embedding)
+        return embedding
+
+    def _cache_get(self, key: bytes) -> np.ndarray | None:
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+        return embedding
+
+    def _cache_put(self, key: bytes, embedding: list[float]) -> None:
+        if self._embedding_cache_size <= 0:
+            return
+        self._embedding_cache[key] = np.asarray(embedding, dtype=np.float32)
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > self._embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+
     async def _encode_async(self, text: str) -> list[float]:
         """
         Encode text using SentenceTransformer in threadpool executor.
@@ -340,6 +425,65 @@ class EmbeddingService:
         return embedding_list
 
 
+    async def _encode_batch_async(self, texts: list[str]) -> list[list[float]]:
+        """
+        Encode a batch of texts in the threadpool executor (one model call).
+
+        Args:
+            texts: Texts to encode (already prefixed)
+
+        Returns:
+            Embedding vectors as lists of floats, in input order
+
+        Raises:
+            RuntimeError: If model not initialized
+            ValueError: If encoding produces invalid output
+        """
+        if self.model is None:
+            raise RuntimeError("Model not initialized. Call warmup() first.")
+
+        if self._semaphore is None:
+            raise RuntimeError("Semaphore not initialized. Call warmup() first.")
+
+        loop = asyncio.get_running_loop()
+        model = self.model  # Capture reference for closure
+
+        async with self._semaphore:
+            embedding_array = await loop.run_in_executor(
+                None,
+                lambda: model.encode(
+                    texts,
+                    batch_size=_PASSAGE_BATCH_SIZE,
+                    normalize_embeddings=True,
+                ),
+            )
+
+        embedding_lists = embedding_array.tolist()
+
+        if len(embedding_lists) != len(texts) or not embedding_lists[0]:
+            raise ValueError(
+                f"Invalid batch embedding output: expected {len(texts)} vectors"
+            )
+
+        return embedding_lists
+
+
+def _resolve_max_concurrency(configured: int | None, device: str) -> int:
+    """
+    Concurrent encode() limit.
+
+    On CPU each encode() already spreads over torch.get_num_threads() cores,
+    so overlapping calls only contend for the same cores; serialize them.
+    """
+    if configured is not None:
+        return max(1, configured)
+    return 4 if device == "cuda" else 1
+
+
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
 # Singleton getter function for dependency injection
 def get_embedding_service() -> EmbeddingService:
     """Get or create the singleton EmbeddingService instance."""
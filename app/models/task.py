@@ -75,6 +75,11 @@ class ManualReviewTask(BaseModel):
         nullable=True,
         comment="비교 로직/threshold 버전 식별 키",
     )
+    comparison_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="초안 텍스트 + 비교 후보 ID sha256 (승인 가드 재검증 생략 판단용)",
+    )
 
     status: Mapped[TaskStatus] = mapped_column(
         SQLEnum(TaskStatus, name="task_status"),
@@ -244,6 +244,50 @@ class CommonCodeItemRepository(BaseRepository[CommonCodeItem]):
         )
         return items
 
+    async def get_by_key(
+        self, group_code: str, code_key: str, is_active_only: bool = False
+    ) -> CommonCodeItem | None:
+        """
+        그룹 코드 + 코드 키로 단일 항목 조회 (그룹 조회 없이 한 번의 쿼리)
+
+        Args:
+            group_code: 그룹 코드 (예: BUSINESS_TYPE)
+            code_key: 코드 키
+            is_active_only: True면 활성 항목만 조회
+
+        Returns:
+            CommonCodeItem 또는 None
+        """
+        # Use raw SQL due to SQLAlchemy ORM metadata caching issues
+        from sqlalchemy import text
+
+        sql = (
+            "SELECT i.* FROM common_code_items i "
+            "JOIN common_code_groups g ON g.id = i.group_id "
+            "WHERE g.group_code = :group_code AND i.code_key = :code_key"
+        )
+        if is_active_only:
+            sql += " AND i.is_active = true"
+        sql += " LIMIT 1"
+        params = {"group_code": group_code, "code_key": code_key}
+        result = await self.session.execute(text(sql), params)
+
+        row = result.mappings().first()
+        if not row:
+            return None
+
+        return CommonCodeItem(
+            id=row['id'],
+            group_id=row['group_id'],
+            code_key=row['code_key'],
+            code_value=row['code_value'],
+            sort_order=row['sort_order'],
+            is_active=row['is_active'],
+            attributes=row['attributes'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at'],
+        )
+
     async def get_by_code_key(
         self, group_id: UUID, code_key: str
     ) -> CommonCodeItem | None:
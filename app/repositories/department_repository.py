@@ -2,13 +2,14 @@
 Department repository
 """
 
-from typing import Sequence
+from typing import Any, Sequence, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.department import Department
+from app.models.department import Department, UserDepartment
 
 
 class DepartmentRepository:
@@ -61,6 +62,27 @@ class DepartmentRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def link_user_department_if_missing(
+        self,
+        user_id: int,
+        department_id: UUID,
+        *,
+        is_primary: bool = False,
+    ) -> bool:
+        """사용자-부서 링크가 없을 때만 추가한다 (INSERT ... ON CONFLICT DO NOTHING).
+
+        Returns:
+            새 링크를 추가했으면 True
+        """
+
+        stmt = (
+            insert(UserDepartment)
+            .values(user_id=user_id, department_id=department_id, is_primary=is_primary)
+            .on_conflict_do_nothing(index_elements=["user_id", "department_id"])
+        )
+        result = cast(CursorResult[Any], await self.session.execute(stmt))
+        return result.rowcount > 0
+
     async def create_department(self, department: Department) -> Department:
         """부서 생성"""
 
@@ -6,7 +6,7 @@ Database operations for Manual models
 from uuid import UUID
 from typing import Any, Literal, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -119,12 +119,15 @@ class ManualEntryRDBRepository(BaseRepository[ManualEntry]):
     async def find_by_consultation_id(
         self,
         consultation_id: UUID,
+        *,
+        statuses: set[ManualStatus] | None = None,
     ) -> Sequence[ManualEntry]:
         """
         Find manual entries created from specific consultation
 
         Args:
             consultation_id: Source consultation UUID
+            statuses: Optional status filter set (applied in SQL)
 
         Returns:
             List of manual entries
@@ -132,6 +135,8 @@ class ManualEntryRDBRepository(BaseRepository[ManualEntry]):
         stmt = select(ManualEntry).where(
             ManualEntry.source_consultation_id == consultation_id
         )
+        if statuses:
+            stmt = stmt.where(ManualEntry.status.in_(statuses))
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -140,10 +145,13 @@ class ManualEntryRDBRepository(BaseRepository[ManualEntry]):
         version_id: UUID,
         *,
         statuses: set[ManualStatus] | None = None,
-    ) -> Sequence[ManualEntry]:
+    ) -> list[ManualEntry]:
         """
         Find manual entries that belong to a specific version.
 
+        The status filter is applied in SQL, so callers receive only the
+        requested statuses and can use the returned list as-is.
+
         Args:
             version_id: ManualVersion UUID
             statuses: Optional status filter set
@@ -153,9 +161,9 @@ class ManualEntryRDBRepository(BaseRepository[ManualEntry]):
         """
         stmt = select(ManualEntry).where(ManualEntry.version_id == version_id)
         if statuses:
-            stmt = stmt.where(ManualEntry.status.in_(list(statuses)))
+            stmt = stmt.where(ManualEntry.status.in_(statuses))
         result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return list(result.scalars())
 
     async def find_by_business_and_error(
         self,
@@ -311,6 +319,44 @@ class ManualEntryRDBRepository(BaseRepository[ManualEntry]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def mark_approved(
+        self,
+        manual_id: UUID,
+        *,
+        version_id: UUID,
+        replaced_manual_id: UUID | None = None,
+    ) -> ManualEntry:
+        """
+        Mark a manual entry as APPROVED and attach it to a version.
+
+        Issues a single UPDATE ... RETURNING so the in-session instance is
+        refreshed without a follow-up SELECT.
+
+        Args:
+            manual_id: ManualEntry UUID
+            version_id: ManualVersion UUID to attach
+            replaced_manual_id: Optional ID of the manual this entry replaces
+
+        Returns:
+            Updated manual entry
+        """
+        values: dict[str, Any] = {
+            "status": ManualStatus.APPROVED,
+            "version_id": version_id,
+        }
+        if replaced_manual_id is not None:
+            values["replaced_manual_id"] = replaced_manual_id
+
+        stmt = (
+            update(ManualEntry)
+            .where(ManualEntry.id == manual_id)
+            .values(**values)
+            .returning(ManualEntry)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     # TODO: Add more query methods
     # async def find_approved_by_keywords(...)
     # async def deprecate_entry(...)
@@ -348,6 +394,48 @@ class ManualVersionRepository(BaseRepository[ManualVersion]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def create_for_group(
+        self,
+        *,
+        version: str,
+        business_type: str | None,
+        error_code: str | None,
+    ) -> ManualVersion:
+        """
+        Insert a new ManualVersion for a group.
+
+        Uses INSERT ... RETURNING so server-generated columns (created_at)
+        come back with the insert instead of a separate refresh.
+        """
+        stmt = (
+            insert(ManualVersion)
+            .values(
+                version=version,
+                business_type=business_type,
+                error_code=error_code,
+            )
+            .returning(ManualVersion)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def get_by_ids(self, ids: list[UUID]) -> Sequence[ManualVersion]:
+        """
+        Get ManualVersions by list of IDs in a single query.
+
+        Args:
+            ids: List of ManualVersion UUIDs
+
+        Returns:
+            List of manual versions (order not guaranteed)
+        """
+        if not ids:
+            return []
+
+        stmt = select(ManualVersion).where(ManualVersion.id.in_(ids))
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def get_by_version(
         self,
         version: str,
@@ -365,6 +453,33 @@ class ManualVersionRepository(BaseRepository[ManualVersion]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def get_by_versions(
+        self,
+        versions: list[str],
+        business_type: str | None = None,
+        error_code: str | None = None,
+    ) -> dict[str, ManualVersion]:
+        """
+        Get several ManualVersions by version string in a single query.
+
+        Returns:
+            Mapping of version string -> ManualVersion (missing versions are absent)
+        """
+        if not versions:
+            return {}
+
+        stmt = select(ManualVersion).where(ManualVersion.version.in_(versions))
+        if business_type is not None:
+            stmt = stmt.where(ManualVersion.business_type == business_type)
+        if error_code is not None:
+            stmt = stmt.where(ManualVersion.error_code == error_code)
+        result = await self.session.execute(stmt)
+
+        found: dict[str, ManualVersion] = {}
+        for version in result.scalars():
+            found.setdefault(version.version, version)
+        return found
+
     async def list_versions(
         self,
         business_type: str | None = None,
@@ -400,6 +515,22 @@ class ManualReviewTaskRepository(BaseRepository[ManualReviewTask]):
             selectinload(ManualReviewTask.new_entry),
         )
 
+    async def find_by_ids(self, ids: list[UUID]) -> Sequence[ManualReviewTask]:
+        """
+        Find review tasks by IDs
+
+        Args:
+            ids: Review task IDs
+
+        Returns:
+            Review tasks found (order not guaranteed)
+        """
+        if not ids:
+            return []
+        stmt = select(ManualReviewTask).where(ManualReviewTask.id.in_(ids))
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def find_by_status(
         self,
         status: TaskStatus,
@@ -529,6 +660,31 @@ class ManualReviewTaskRepository(BaseRepository[ManualReviewTask]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def delete_by_manual_id(self, manual_id: UUID) -> int:
+        """
+        Delete all review tasks whose new_entry_id is manual_id in one statement.
+
+        Task history rows are removed by the FK's ON DELETE CASCADE.
+
+        Returns:
+            Number of deleted review tasks
+        """
+        stmt = delete(ManualReviewTask).where(ManualReviewTask.new_entry_id == manual_id)
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def exists_by_manual_id(self, manual_id: UUID) -> bool:
+        """
+        Check whether any review task exists for the manual (new_entry_id).
+        """
+        stmt = (
+            select(ManualReviewTask.id)
+            .where(ManualReviewTask.new_entry_id == manual_id)
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
     async def find_by_manual_id_with_entries(
         self,
         manual_id: UUID,
@@ -566,6 +722,31 @@ class ManualReviewTaskRepository(BaseRepository[ManualReviewTask]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def mark_done(
+        self,
+        task_id: UUID,
+        *,
+        reviewer_id: str | None,
+    ) -> ManualReviewTask:
+        """
+        Mark a review task as DONE in a single UPDATE ... RETURNING.
+
+        An already assigned reviewer is kept; ``reviewer_id`` only fills an
+        empty slot.
+        """
+        stmt = (
+            update(ManualReviewTask)
+            .where(ManualReviewTask.id == task_id)
+            .values(
+                status=TaskStatus.DONE,
+                reviewer_id=func.coalesce(ManualReviewTask.reviewer_id, reviewer_id),
+            )
+            .returning(ManualReviewTask)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     # TODO: Add workflow methods
     # async def approve_task(...)
     # async def reject_task(...)
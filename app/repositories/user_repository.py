@@ -4,7 +4,8 @@ User repository
 
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -76,6 +77,32 @@ class UserRepository:
         await self.session.refresh(user)
         return user
 
+    async def create_user_if_absent(
+        self,
+        data: UserCreate,
+        *,
+        password_hash: str,
+    ) -> User | None:
+        """employee_id가 없을 때만 사용자 생성 (INSERT ... ON CONFLICT DO NOTHING RETURNING).
+
+        중복 확인과 생성을 한 번의 왕복으로 처리하며, 이미 존재하면 None을 반환한다.
+        """
+
+        stmt = (
+            pg_insert(User)
+            .values(
+                employee_id=data.employee_id,
+                name=data.name,
+                role=data.role,
+                password_hash=password_hash,
+                is_active=data.is_active,
+            )
+            .on_conflict_do_nothing(index_elements=["employee_id"])
+            .returning(User)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def update_user(self, user: User) -> User:
         """사용자 업데이트 처리."""
 
@@ -139,22 +166,29 @@ class UserRepository:
         departments: list[Department],
         *,
         primary_department_id: UUID,
-    ) -> list[UserDepartment]:
-        """사용자에 연결된 부서 매핑을 교체한다."""
+    ) -> None:
+        """사용자에 연결된 부서 매핑을 교체한다.
+
+        새 매핑은 부서 수와 무관하게 한 번의 multi-row INSERT로 추가한다.
+        최신 매핑이 필요하면 get_with_departments로 다시 로딩한다.
+        """
 
         await self.session.execute(
             delete(UserDepartment).where(UserDepartment.user_id == user.id)
         )
 
-        links: list[UserDepartment] = []
-        for department in departments:
-            link = UserDepartment(
-                user_id=user.id,
-                department_id=department.id,
-                is_primary=department.id == primary_department_id,
-            )
-            self.session.add(link)
-            links.append(link)
+        if not departments:
+            return
 
-        await self.session.flush()
-        return links
+        await self.session.execute(
+            insert(UserDepartment).values(
+                [
+                    {
+                        "user_id": user.id,
+                        "department_id": department.id,
+                        "is_primary": department.id == primary_department_id,
+                    }
+                    for department in departments
+                ]
+            )
+        )
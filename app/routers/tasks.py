@@ -13,6 +13,7 @@ from app.core.db import get_session
 from app.schemas.manual import (
     ManualReviewTaskResponse,
     ManualReviewApproval,
+    ManualReviewBulkApproval,
     ManualReviewRejection,
 )
 from app.services.manual_service import ManualService
@@ -235,6 +236,65 @@ async def approve_review_task(
         ) from exc
 
 
+@router.post(
+    "/tasks/bulk-approve",
+    response_model=list[ManualReviewTaskResponse],
+    summary="Approve multiple manual review tasks",
+    responses=combined_responses(
+        status_code=200,
+        data_example=[
+            {
+                "id": "uuid-task-1",
+                "status": "DONE",
+                "review_notes": "일괄 승인",
+            }
+        ],
+        include_errors=[400, 404, 409, 500],
+    ),
+)
+async def bulk_approve_review_tasks(
+    data: ManualReviewBulkApproval,
+    service: TaskService = Depends(get_task_service),
+    current_user: User = Depends(
+        require_roles(UserRole.REVIEWER, UserRole.ADMIN),
+    ),
+) -> list[ManualReviewTaskResponse]:
+    """
+    메뉴얼 검토 태스크 일괄 승인
+
+    **요청:**
+    ```json
+    {
+      "task_ids": ["uuid-task-1", "uuid-task-2"],
+      "employee_id": "reviewer-001",
+      "review_notes": "일괄 승인"
+    }
+    ```
+
+    **동작:**
+    - 각 태스크에 대해 단건 승인(`/tasks/{task_id}/approve`)과 동일하게 처리
+    - 상태 변경 이력은 한 번에 기록
+
+    **에러 응답:**
+    - 404 Not Found: 존재하지 않는 태스크가 포함됨
+    - 403 Forbidden: 승인 권한이 없는 태스크가 포함됨
+    - 409 Conflict: 재검토 필요 (비즈니스 로직 오류)
+    """
+    sanitized_payload = data.model_copy(
+        update={"employee_id": current_user.employee_id}
+    )
+    try:
+        return await service.bulk_approve_tasks(
+            sanitized_payload,
+            current_user=current_user,
+        )
+    except AuthorizationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(exc),
+        ) from exc
+
+
 @router.post(
     "/tasks/{task_id}/reject",
     response_model=ManualReviewTaskResponse,
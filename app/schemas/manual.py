@@ -223,6 +223,16 @@ class ManualReviewApproval(BaseSchema):
     )
 
 
+class ManualReviewBulkApproval(ManualReviewApproval):
+    """
+    Schema for approving several manual reviews at once
+
+    RFP Reference: POST /manual-review/tasks/bulk-approve
+    """
+
+    task_ids: list[UUID] = Field(min_length=1, description="Review task IDs to approve")
+
+
 class ManualReviewRejection(BaseSchema):
     """
     Schema for rejecting manual review
@@ -0,0 +1,67 @@
+"""
+공통코드 매핑 캐시
+
+공통코드(BUSINESS_TYPE 등)는 거의 바뀌지 않는 조회 테이블이므로, 그룹별
+code_key -> code_value 매핑을 프로세스 단위로 TTL 동안 보관한다.
+서비스는 요청마다 생성되므로 캐시는 모듈 수준에 둔다.
+공통코드가 변경되면 CommonCodeService가 invalidate_common_code_map()으로 비운다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from app.repositories.common_code_rdb import CommonCodeItemRepository
+
+# 다른 워커 프로세스의 변경은 무효화가 전달되지 않으므로 TTL은 짧게 유지
+_COMMON_CODE_MAP_TTL_SECONDS = 60.0
+
+# group_code -> (갱신 시각, 매핑)
+_common_code_maps: dict[str, tuple[float, dict[str, str]]] = {}
+_common_code_map_lock = asyncio.Lock()
+
+
+def get_cached_common_code_map(group_code: str) -> dict[str, str] | None:
+    """TTL 안에 있는 그룹 매핑 (없거나 만료되면 None)."""
+
+    cached = _common_code_maps.get(group_code)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < _COMMON_CODE_MAP_TTL_SECONDS
+    ):
+        return cached[1]
+    return None
+
+
+async def get_common_code_map(
+    group_code: str,
+    item_repo: CommonCodeItemRepository,
+) -> dict[str, str]:
+    """
+    활성 공통코드 항목의 code_key -> code_value 매핑 조회
+
+    캐시가 만료되면 Lock으로 한 요청만 DB에서 다시 읽어온다.
+    """
+    cached = get_cached_common_code_map(group_code)
+    if cached is not None:
+        return cached
+
+    async with _common_code_map_lock:
+        cached = get_cached_common_code_map(group_code)
+        if cached is not None:
+            return cached
+
+        items = await item_repo.get_by_group_code(group_code, is_active_only=True)
+        code_map = {item.code_key: item.code_value for item in items}
+        _common_code_maps[group_code] = (time.monotonic(), code_map)
+        return code_map
+
+
+def invalidate_common_code_map(group_code: str | None = None) -> None:
+    """그룹 매핑 캐시 무효화 (group_code가 없으면 전체)."""
+
+    if group_code is None:
+        _common_code_maps.clear()
+    else:
+        _common_code_maps.pop(group_code, None)
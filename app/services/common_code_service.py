@@ -23,6 +23,7 @@ from app.repositories.common_code_rdb import (
     CommonCodeGroupRepository,
     CommonCodeItemRepository,
 )
+from app.services.common_code_cache import invalidate_common_code_map
 from app.schemas.common_code import (
     CommonCodeGroupCreate,
     CommonCodeGroupUpdate,
@@ -102,6 +103,7 @@ class CommonCodeService:
 
         group = await self.group_repo.create(group)
         await self.session.commit()
+        invalidate_common_code_map()
 
         logger.info(
             "common_code_group_created",
@@ -329,6 +331,7 @@ class CommonCodeService:
 
         group = await self.group_repo.update(group)
         await self.session.commit()
+        invalidate_common_code_map()
 
         logger.info(
             "common_code_group_updated",
@@ -367,6 +370,7 @@ class CommonCodeService:
         params = {"group_id": str(group_id)}
         result = await self.session.execute(text(sql), params)
         await self.session.commit()
+        invalidate_common_code_map()
 
         logger.info(
             "common_code_group_deleted",
@@ -436,6 +440,7 @@ class CommonCodeService:
 
         item = await self.item_repo.create(item)
         await self.session.commit()
+        invalidate_common_code_map()
 
         logger.info(
             "common_code_item_created",
@@ -570,6 +575,7 @@ class CommonCodeService:
 
         item = await self.item_repo.update(item)
         await self.session.commit()
+        invalidate_common_code_map()
 
         logger.info(
             "common_code_item_updated",
@@ -599,6 +605,7 @@ class CommonCodeService:
         params = {"item_id": str(item_id)}
         result = await self.session.execute(text(sql), params)
         await self.session.commit()
+        invalidate_common_code_map()
 
         logger.info(
             "common_code_item_deleted",
@@ -9,7 +9,7 @@ FR-11(v2.1): Document-Set Version Management with Smart Comparison
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, Optional
 from uuid import UUID
 
@@ -42,6 +42,8 @@ class ComparisonResult:
     similarity_score: Optional[float] = None
     reason: str = ""
     compare_version: str | None = None
+    # 그룹 기반 비교 시 후보로 사용된 APPROVED 메뉴얼 ID (승인 가드 fingerprint용)
+    candidate_ids: list[UUID] = field(default_factory=list)
 
 
 class ComparisonService:
@@ -77,11 +79,16 @@ class ComparisonService:
         self._missing_forbidden_keyword_hint = missing_keyword_hint
 
         candidates = await self._collect_candidates(new_draft, compare_with_manual_id)
+        # 지정 메뉴얼 비교는 승인 가드(그룹 전체 후보)와 후보 집합이 달라 기록하지 않는다.
+        candidate_ids = (
+            [] if compare_with_manual_id else [candidate.id for candidate in candidates]
+        )
         if not candidates:
             return ComparisonResult(
                 comparison_type=ComparisonType.NEW,
                 reason=self._with_keyword_hint("no_candidates"),
                 compare_version=COMPARISON_VERSION,
+                candidate_ids=candidate_ids,
             )
 
         filtered_candidates, keyword_scores = self._apply_keyword_compression(
@@ -97,6 +104,7 @@ class ComparisonService:
                 comparison_type=ComparisonType.NEW,
                 reason=self._with_keyword_hint("no_vector_results"),
                 compare_version=COMPARISON_VERSION,
+                candidate_ids=candidate_ids,
             )
 
         if best_similarity >= similarity_threshold_similar:
@@ -112,6 +120,7 @@ class ComparisonService:
             similarity_score=best_similarity,
             reason=self._with_keyword_hint(f"similarity_{best_similarity:.2f}"),
             compare_version=COMPARISON_VERSION,
+            candidate_ids=candidate_ids,
         )
 
     async def find_best_match_candidate(
@@ -6,13 +6,18 @@ Manual Service (FR-2/FR-9 1차 구현)
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Coroutine, Sequence
 from uuid import UUID, uuid4
+import asyncio
+import functools
+import hashlib
 import time
-import json
 from datetime import datetime, timezone
 
+from pydantic import BaseModel
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.core.exceptions import (
     AuthorizationError,
@@ -72,13 +77,85 @@ from app.services.validation import (
     validate_keywords_in_source,
     validate_sentences_subset_of_source,
 )
+from app.services.common_code_cache import get_cached_common_code_map, get_common_code_map
 from app.services.comparison_service import ComparisonService
 from app.core.config import settings
-from app.core.permissions import filter_tasks_for_user, get_user_department_ids
+from app.core.permissions import get_user_department_ids
 from app.repositories.user_repository import UserRepository
 
 logger = get_logger(__name__)
 
+# ManualEntry 인스턴스에 _build_manual_text 결과를 보관하는 비매핑 속성 이름
+_MANUAL_TEXT_CACHE_ATTR = "_khw_manual_text_cache"
+
+# 백그라운드 태스크가 완료 전에 GC되지 않도록 강한 참조를 유지
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+# 커밋 후 실행할 작업 목록을 보관하는 Session.info 키
+_AFTER_COMMIT_JOBS_KEY = "khw_after_commit_jobs"
+
+# create_draft_from_consultation 응답 메시지 (comparison_type별)
+_DRAFT_RESPONSE_MESSAGES: dict[ComparisonType, str] = {
+    ComparisonType.SIMILAR: (
+        "기존 메뉴얼(버전 {version_id})과 {similarity_pct:.0f}% 유사합니다. "
+        "기존 메뉴얼을 참고하세요."
+    ),
+    ComparisonType.SUPPLEMENT: (
+        "기존 메뉴얼(버전 {version_id})의 내용을 보충했습니다. 검토자가 확인 후 승인합니다."
+    ),
+    ComparisonType.NEW: "신규 메뉴얼 초안으로 생성되었습니다.",
+}
+
+# 업무구분 값 → BusinessType (알 수 없는 값은 예외 대신 None)
+_BUSINESS_TYPE_BY_VALUE: dict[str, BusinessType] = {bt.value: bt for bt in BusinessType}
+
+
+class _DiffSummaryPayload(BaseModel):
+    """diff 요약 프롬프트에 넣는 JSON payload.
+
+    필드 타입이 고정된 직렬화 스키마를 클래스 정의 시 한 번만 빌드하므로,
+    항목마다 타입을 추론하지 않고 pydantic-core에서 바로 JSON으로 직렬화한다.
+    """
+
+    base_version: str | None
+    compare_version: str
+    added_entries: list[ManualDiffEntrySnapshot]
+    removed_entries: list[ManualDiffEntrySnapshot]
+    modified_entries: list[ManualModifiedEntry]
+
+
+# ManualEntry(ORM)에서 그대로 옮겨 담는 ManualEntryResponse 필드
+_MANUAL_ENTRY_RESPONSE_FIELDS = tuple(
+    name for name in ManualEntryResponse.model_fields if name != "business_type_name"
+)
+
+
+def _to_manual_entry_response(
+    entry: ManualEntry,
+    business_type_name: str | None = None,
+) -> ManualEntryResponse:
+    """DB에서 읽은 ManualEntry를 검증 없이 ManualEntryResponse로 변환.
+
+    스키마 검증은 라우터의 response_model 경계에서 수행되므로, 서비스 내부
+    변환은 model_construct로 재검증 비용을 생략한다.
+    """
+
+    values = {name: getattr(entry, name) for name in _MANUAL_ENTRY_RESPONSE_FIELDS}
+    values["keywords"] = list(entry.keywords or [])
+    return ManualEntryResponse.model_construct(
+        **values, business_type_name=business_type_name
+    )
+
+
+def _format_version_date(created_at: datetime) -> str:
+    """버전 목록용 날짜 문자열(YYYY-MM-DD).
+
+    목록 응답에서 행마다 호출되므로 포맷 문자열을 해석하는 strftime 대신
+    date.isoformat()을 사용한다 (동일 출력, 더 빠름).
+    """
+
+    return created_at.date().isoformat()
+
 
 def parse_guideline_string(guideline_text: str) -> list[dict[str, str]]:
     """
@@ -182,23 +259,28 @@ class ManualService:
         has_hallucination = False
         fail_reasons: list[str] = []
         if request.enforce_hallucination_check:
-            ok_keywords, missing_kw = validate_keywords_in_source(
-                llm_payload.get("keywords", []), source_text
-            )
-            if not ok_keywords:
-                fail_reasons.append(f"missing_keywords:{','.join(missing_kw)}")
-
-            ok_background, missing_bg = validate_sentences_subset_of_source(
-                llm_payload.get("background", ""), source_text
-            )
-            if not ok_background:
-                fail_reasons.append(f"background_missing:{len(missing_bg)}")
+            # 비어 있는 항목은 검증 결과가 항상 통과이므로 원문 스캔을 생략한다.
+            keywords = llm_payload.get("keywords") or []
+            if keywords:
+                ok_keywords, missing_kw = validate_keywords_in_source(keywords, source_text)
+                if not ok_keywords:
+                    fail_reasons.append(f"missing_keywords:{','.join(missing_kw)}")
+
+            background = llm_payload.get("background") or ""
+            if background.strip():
+                ok_background, missing_bg = validate_sentences_subset_of_source(
+                    background, source_text
+                )
+                if not ok_background:
+                    fail_reasons.append(f"background_missing:{len(missing_bg)}")
 
-            ok_guideline, missing_gl = validate_sentences_subset_of_source(
-                llm_payload.get("guideline", ""), source_text
-            )
-            if not ok_guideline:
-                fail_reasons.append(f"guideline_missing:{len(missing_gl)}")
+            guideline = llm_payload.get("guideline") or ""
+            if guideline.strip():
+                ok_guideline, missing_gl = validate_sentences_subset_of_source(
+                    guideline, source_text
+                )
+                if not ok_guideline:
+                    fail_reasons.append(f"guideline_missing:{len(missing_gl)}")
 
             has_hallucination = bool(fail_reasons)
 
@@ -217,118 +299,134 @@ class ManualService:
         )
 
         # business_type 공통코드 매핑 조회 (한 번만)
-        business_type_items = await self.common_code_item_repo.get_by_group_code(
-            "BUSINESS_TYPE", is_active_only=True
-        )
-        business_type_map = {
-            item.code_key: item.code_value for item in business_type_items
-        }
+        business_type_map = await self._get_business_type_map()
 
-        # Step 6: comparison_type에 따른 분기 처리
-        response: ManualDraftCreateResponse
-        if comparison_result.comparison_type == ComparisonType.SIMILAR:
+        # Step 6: comparison_type에 따른 부수 효과 처리
+        comparison_type = comparison_result.comparison_type
+        existing_manual = (
+            comparison_result.existing_manual
+            if comparison_type != ComparisonType.NEW
+            else None
+        )
+        similarity_score = (
+            comparison_result.similarity_score
+            if comparison_type != ComparisonType.NEW
+            else None
+        )
+        review_task: ManualReviewTask | None = None
+        if comparison_type == ComparisonType.SIMILAR:
             # SIMILAR 경로: 기존 메뉴얼 반환, draft는 ARCHIVED로 표시
             manual_entry.status = ManualStatus.ARCHIVED
             await self.manual_repo.update(manual_entry)
-
-            draft_response = await self._enrich_manual_entry_response(
-                manual_entry, business_type_map
-            )
-            existing_response = await self._enrich_manual_entry_response(
-                comparison_result.existing_manual, business_type_map
-            )
-
-            response = ManualDraftCreateResponse(
-                comparison_type=ComparisonType.SIMILAR,
-                id=manual_entry.id,
-                created_at=manual_entry.created_at,
-                updated_at=manual_entry.updated_at,
-                draft_entry=draft_response,
-                existing_manual=existing_response,
-                similarity_score=comparison_result.similarity_score,
-                comparison_version=comparison_result.compare_version,
-                message=(
-                    f"기존 메뉴얼(버전 {comparison_result.existing_manual.version_id})과 "
-                    f"{comparison_result.similarity_score * 100:.0f}% 유사합니다. "
-                    "기존 메뉴얼을 참고하세요."
-                ),
-            )
-
-        elif comparison_result.comparison_type == ComparisonType.SUPPLEMENT:
-            # SUPPLEMENT 경로: 자동 병합 + 리뷰 태스크
+        else:
+            # SUPPLEMENT 경로: 자동 병합 + 리뷰 태스크 / NEW 경로: 신규 draft 리뷰 태스크
+            is_supplement = comparison_type == ComparisonType.SUPPLEMENT
             review_task = await self._create_review_task(
                 consultation=consultation,
                 new_entry=manual_entry,
-                old_entry=comparison_result.existing_manual,
-                comparison_type=ComparisonType.SUPPLEMENT,
-                similarity_score=comparison_result.similarity_score,
+                old_entry=existing_manual,
+                comparison_type=comparison_type,
+                similarity_score=similarity_score,
                 compare_version=comparison_result.compare_version,
                 reason=comparison_result.reason,
-                auto_merged=True,
-            )
-
-            draft_response = await self._enrich_manual_entry_response(
-                manual_entry, business_type_map
-            )
-            existing_response = await self._enrich_manual_entry_response(
-                comparison_result.existing_manual, business_type_map
-            )
-
-            response = ManualDraftCreateResponse(
-                comparison_type=ComparisonType.SUPPLEMENT,
-                id=manual_entry.id,
-                created_at=manual_entry.created_at,
-                updated_at=manual_entry.updated_at,
-                draft_entry=draft_response,
-                existing_manual=existing_response,
-                review_task_id=review_task.id,
-                similarity_score=comparison_result.similarity_score,
-                comparison_version=comparison_result.compare_version,
-                message=(
-                    f"기존 메뉴얼(버전 {comparison_result.existing_manual.version_id})의 "
-                    f"내용을 보충했습니다. 검토자가 확인 후 승인합니다."
+                auto_merged=is_supplement,
+                candidate_ids=(
+                    comparison_result.candidate_ids
+                    if is_supplement and not request.compare_with_manual_id
+                    else None
                 ),
             )
 
-        else:  # ComparisonType.NEW
-            # NEW 경로: 신규 draft, 리뷰 태스크 생성
-            review_task = await self._create_review_task(
-                consultation=consultation,
-                new_entry=manual_entry,
-                old_entry=None,
-                comparison_type=ComparisonType.NEW,
-                similarity_score=None,
-                compare_version=comparison_result.compare_version,
-                reason=comparison_result.reason,
-                auto_merged=False,
-            )
-
-            draft_response = await self._enrich_manual_entry_response(
-                manual_entry, business_type_map
-            )
+        enriched = await self._enrich_manual_entry_responses(
+            [manual_entry] if existing_manual is None else [manual_entry, existing_manual],
+            business_type_map,
+        )
 
-            response = ManualDraftCreateResponse(
-                comparison_type=ComparisonType.NEW,
-                id=manual_entry.id,
-                created_at=manual_entry.created_at,
-                updated_at=manual_entry.updated_at,
-                draft_entry=draft_response,
-                existing_manual=None,
-                review_task_id=review_task.id,
-                similarity_score=None,
-                comparison_version=comparison_result.compare_version,
-                message="신규 메뉴얼 초안으로 생성되었습니다.",
-            )
+        # Step 7: 공통 필드는 한 번만 채우고 경로별 차이는 메시지 템플릿으로 처리
+        response = ManualDraftCreateResponse(
+            comparison_type=comparison_type,
+            id=manual_entry.id,
+            created_at=manual_entry.created_at,
+            updated_at=manual_entry.updated_at,
+            draft_entry=enriched[0],
+            existing_manual=enriched[1] if existing_manual is not None else None,
+            review_task_id=review_task.id if review_task is not None else None,
+            similarity_score=similarity_score,
+            comparison_version=comparison_result.compare_version,
+            message=_DRAFT_RESPONSE_MESSAGES[comparison_type].format(
+                version_id=existing_manual.version_id if existing_manual else None,
+                similarity_pct=(similarity_score or 0.0) * 100,
+            ),
+        )
 
         await self._mark_consultation_manual_generated(consultation)
         return response
 
     async def _mark_consultation_manual_generated(self, consultation: Consultation) -> None:
-        """정상 종료 시 상담에 플래그와 타임스탬프를 기록."""
+        """정상 종료 시 상담에 플래그와 타임스탬프를 기록.
+
+        응답이 이 값에 의존하지 않으므로 별도 flush 없이 요청 트랜잭션의
+        커밋 시점에 함께 반영한다.
+        """
 
         consultation.is_manual_generated = True
         consultation.manual_generated_at = datetime.now(timezone.utc)
-        await self.session.flush()
+
+    def _spawn_after_commit(
+        self,
+        name: str,
+        job: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """현재 트랜잭션이 커밋된 뒤 job을 백그라운드 태스크로 실행.
+
+        롤백되면 실행하지 않는다. 실제 AsyncSession이 아닌 경우(테스트 더블 등)
+        바로 백그라운드로 실행한다.
+        """
+
+        sync_session = getattr(self.session, "sync_session", None)
+        if not isinstance(sync_session, Session):
+            self._spawn_background(name, job)
+            return
+
+        pending: list[tuple[str, Callable[[], Coroutine[Any, Any, None]]]] | None = (
+            sync_session.info.get(_AFTER_COMMIT_JOBS_KEY)
+        )
+        if pending is None:
+            pending = sync_session.info[_AFTER_COMMIT_JOBS_KEY] = []
+
+            def _on_commit(session: Session) -> None:
+                jobs = session.info.get(_AFTER_COMMIT_JOBS_KEY, [])
+                while jobs:
+                    self._spawn_background(*jobs.pop(0))
+
+            def _on_rollback(session: Session) -> None:
+                session.info.get(_AFTER_COMMIT_JOBS_KEY, []).clear()
+
+            event.listen(sync_session, "after_commit", _on_commit)
+            event.listen(sync_session, "after_rollback", _on_rollback)
+
+        pending.append((name, job))
+
+    def _spawn_background(
+        self,
+        name: str,
+        job: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """job을 asyncio 태스크로 띄우고 실패 시 로그/메트릭만 남긴다."""
+
+        task = asyncio.create_task(job(), name=name)
+        _background_tasks.add(task)
+
+        def _on_done(done: asyncio.Task[Any]) -> None:
+            _background_tasks.discard(done)
+            if done.cancelled():
+                return
+            exc = done.exception()
+            if exc is not None:
+                logger.error("background_task_failed", task=name, error=str(exc))
+                metrics_counter(f"{name}_async_fail")
+
+        task.add_done_callback(_on_done)
 
     def _ensure_draft_view_allowed(self, manual: ManualEntry, current_user: User) -> None:
         if manual.status != ManualStatus.DRAFT:
@@ -350,23 +448,7 @@ class ManualService:
 
         self._ensure_draft_view_allowed(manual, current_user)
 
-        response = ManualEntryResponse.model_validate(manual)
-        
-        # business_type_name 조회 및 추가
-        if manual.business_type:
-            business_type_items = await self.common_code_item_repo.get_by_group_code(
-                "BUSINESS_TYPE", is_active_only=True
-            )
-            business_type_map = {
-                item.code_key: item.code_value for item in business_type_items
-            }
-            response = response.model_copy(
-                update={
-                    "business_type_name": business_type_map.get(manual.business_type)
-                }
-            )
-        
-        return response
+        return await self._enrich_manual_entry_response(manual)
 
     async def get_manual_by_version(
         self, manual_id: UUID, version: str
@@ -392,11 +474,9 @@ class ManualService:
             raise RecordNotFoundError(f"Manual version '{version}' not found")
 
         # 해당 버전의 메뉴얼 항목 조회 (APPROVED 상태만)
-        entries = list(
-            await self.manual_repo.find_by_version(
-                manual_version.id,
-                statuses={ManualStatus.APPROVED},
-            )
+        entries = await self.manual_repo.find_by_version(
+            manual_version.id,
+            statuses={ManualStatus.APPROVED},
         )
 
         if not entries:
@@ -456,6 +536,7 @@ class ManualService:
                 "error_code": manual.error_code,
                 "status": "APPROVED",
             },
+            include_metadata=False,
         )
 
         candidate_ids = [
@@ -539,7 +620,10 @@ class ManualService:
             compared_with_manual_id=str(review_task.old_entry_id) if review_task.old_entry_id else None,
         )
 
-        if review_task.comparison_type in {ComparisonType.SIMILAR, ComparisonType.SUPPLEMENT}:
+        if review_task.comparison_type in {
+            ComparisonType.SIMILAR,
+            ComparisonType.SUPPLEMENT,
+        } and not await self._is_comparison_unchanged(manual, review_task):
             guard_candidate = await self.comparison_service.find_best_match_candidate(manual)
             if guard_candidate and guard_candidate.id != review_task.old_entry_id:
                 raise NeedsReReviewError(
@@ -552,12 +636,12 @@ class ManualService:
         )
         next_version_num = self._next_version_number(latest_version)
 
-        next_version = ManualVersion(
+        # INSERT ... RETURNING으로 버전을 생성해 created_at 재조회를 생략한다.
+        next_version = await self.version_repo.create_for_group(
             version=str(next_version_num),
             business_type=manual.business_type,
             error_code=manual.error_code,
         )
-        await self.version_repo.create(next_version)
 
         if review_task.comparison_type in {ComparisonType.SIMILAR, ComparisonType.SUPPLEMENT}:
             if review_task.old_entry_id:
@@ -569,15 +653,21 @@ class ManualService:
                     approver_id=request.approver_id,
                 )
 
-        manual.status = ManualStatus.APPROVED
-        manual.version_id = next_version.id
-        await self.manual_repo.update(manual)
-
-        review_task.status = TaskStatus.DONE
-        review_task.reviewer_id = review_task.reviewer_id or request.approver_id
-        await self.review_repo.update(review_task)
+        # 상태/버전/대체관계와 태스크 완료 처리를 각각 UPDATE ... RETURNING 한 번으로 반영
+        manual = await self.manual_repo.mark_approved(
+            manual.id,
+            version_id=next_version.id,
+            replaced_manual_id=manual.replaced_manual_id,
+        )
+        await self.review_repo.mark_done(
+            review_task.id,
+            reviewer_id=request.approver_id,
+        )
 
-        await self._index_manual_vector(manual)
+        # 응답은 버전 정보만 필요하므로 VectorStore 반영은 커밋 이후 백그라운드로 처리
+        self._spawn_after_commit(
+            "manual_index", functools.partial(self._index_manual_vector, manual)
+        )
 
         return ManualVersionInfo(
             version=next_version.version,
@@ -612,7 +702,7 @@ class ManualService:
         result: list[ManualVersionResponse] = []
         for idx, v in enumerate(group_versions):
             label = f"{v.version} (현재 버전)" if idx == 0 else v.version
-            date_str = v.created_at.strftime("%Y-%m-%d")
+            date_str = _format_version_date(v.created_at)
             result.append(
                 ManualVersionResponse(
                     version=v.version,
@@ -643,25 +733,10 @@ class ManualService:
         )
         
         # business_type 공통코드 매핑 조회 (한 번만)
-        business_type_items = await self.common_code_item_repo.get_by_group_code(
-            "BUSINESS_TYPE", is_active_only=True
-        )
-        business_type_map = {
-            item.code_key: item.code_value for item in business_type_items
-        }
+        business_type_map = await self._get_business_type_map()
         
         # 각 entry를 응답으로 변환하고 business_type_name 추가
-        responses = []
-        for entry in entries:
-            response = ManualEntryResponse.model_validate(entry)
-            response = response.model_copy(
-                update={
-                    "business_type_name": business_type_map.get(entry.business_type)
-                }
-            )
-            responses.append(response)
-        
-        return responses
+        return await self._enrich_manual_entry_responses(list(entries), business_type_map)
 
     async def get_approved_group_by_manual_id(
         self, manual_id: UUID
@@ -685,21 +760,9 @@ class ManualService:
             error_code=manual.error_code,
         )
 
-        business_type_items = await self.common_code_item_repo.get_by_group_code(
-            "BUSINESS_TYPE", is_active_only=True
-        )
-        business_type_map = {
-            item.code_key: item.code_value for item in business_type_items
-        }
-
-        responses: list[ManualEntryResponse] = []
-        for entry in entries:
-            response = await self._enrich_manual_entry_response(
-                entry, business_type_map=business_type_map
-            )
-            responses.append(response)
+        business_type_map = await self._get_business_type_map()
 
-        return responses
+        return await self._enrich_manual_entry_responses(entries, business_type_map)
 
     async def get_manual_versions_by_group(
         self,
@@ -757,23 +820,33 @@ class ManualService:
                 f"error_code={error_code}"
             )
 
-        # Step 2: ManualVersion 기반으로 정보 구성
+        # Step 2: ManualVersion 기반으로 정보 구성 (버전은 한 번에 조회)
+        version_ids = list({m.version_id for m in manuals if m.version_id})
+        versions = await self.version_repo.get_by_ids(version_ids)
+        version_map = {v.id: v for v in versions}
+
+        # 최신 APPROVED 메뉴얼은 그룹 단위로 한 번만 조회
+        latest_id = None
+        if any(m.status == ManualStatus.APPROVED for m in manuals):
+            latest = await self.manual_repo.find_latest_by_group(
+                business_type=business_type,
+                error_code=error_code,
+                status=ManualStatus.APPROVED,
+            )
+            latest_id = latest.id if latest else None
+
         responses: list[ManualVersionResponse] = []
 
         for manual in manuals:
-            version = await self.version_repo.get_by_id(manual.version_id)
+            if manual.version_id is None:
+                continue
+            version = version_map.get(manual.version_id)
             if version is None:
                 continue
 
             # 상태 표시 레이블
             if manual.status == ManualStatus.APPROVED:
-                # 최신 APPROVED인지 확인
-                latest = await self.manual_repo.find_latest_by_group(
-                    business_type=business_type,
-                    error_code=error_code,
-                    status=ManualStatus.APPROVED,
-                )
-                is_latest = latest and latest.id == manual.id
+                is_latest = latest_id is not None and latest_id == manual.id
                 label = f"{version.version} ({'현재 버전' if is_latest else 'APPROVED'})"
             else:
                 label = f"{version.version} (DEPRECATED)"
@@ -783,7 +856,7 @@ class ManualService:
                     value=version.version,
                     version=version.version,  # alias 용
                     label=label,
-                    date=version.created_at.strftime("%Y-%m-%d"),
+                    date=_format_version_date(version.created_at),
                     status=manual.status,
                     manual_id=manual.id,
                     id=version.id,
@@ -792,9 +865,9 @@ class ManualService:
                 )
             )
 
-        # Step 3: 최신순 정렬 (created_at 기준)
+        # Step 3: 최신순 정렬 (created_at 기준, 같은 날짜 내 순서 보존)
         responses.sort(
-            key=lambda x: x.date,
+            key=lambda x: x.created_at,
             reverse=True,
         )
 
@@ -826,20 +899,16 @@ class ManualService:
             raise RecordNotFoundError("비교할 버전을 찾을 수 없습니다.")
 
         base_entries = (
-            list(
-                await self.manual_repo.find_by_version(
-                    base.id,
-                    statuses={ManualStatus.APPROVED, ManualStatus.DEPRECATED},
-                )
+            await self.manual_repo.find_by_version(
+                base.id,
+                statuses={ManualStatus.APPROVED, ManualStatus.DEPRECATED},
             )
             if base is not None
             else []
         )
-        compare_entries = list(
-            await self.manual_repo.find_by_version(
-                compare.id,
-                statuses={ManualStatus.APPROVED, ManualStatus.DEPRECATED},
-            )
+        compare_entries = await self.manual_repo.find_by_version(
+            compare.id,
+            statuses={ManualStatus.APPROVED, ManualStatus.DEPRECATED},
         )
 
         diff = self._calculate_diff(base_entries, compare_entries)
@@ -882,21 +951,21 @@ class ManualService:
         if active_version is None:
             raise RecordNotFoundError("활성화된 APPROVED 버전이 없습니다.")
 
-        base_entries = list(
-            await self.manual_repo.find_by_version(
-                active_version.id,
-                statuses={ManualStatus.APPROVED},
-            )
+        base_entries = await self.manual_repo.find_by_version(
+            active_version.id,
+            statuses={ManualStatus.APPROVED},
         )
-        related_drafts = await self.manual_repo.find_by_consultation_id(
-            draft_entry.source_consultation_id
+        draft_entries = await self.manual_repo.find_by_consultation_id(
+            draft_entry.source_consultation_id,
+            statuses={ManualStatus.DRAFT},
         )
-        draft_entries = [e for e in related_drafts if e.status == ManualStatus.DRAFT]
         if not draft_entries:
             draft_entries = [draft_entry]
 
-        compare_entries = self._apply_drafts_to_base(base_entries, draft_entries)
-        diff = self._calculate_diff(base_entries, compare_entries)
+        # 논리 키는 항목당 한 번만 계산해 병합/비교 단계에서 재사용
+        base_map = self._key_by_logical_key(base_entries)
+        compare_map = self._apply_drafts_to_base(base_map, draft_entries)
+        diff = self._diff_keyed_entries(base_map, compare_map)
 
         summary = (
             await self._summarize_diff(
@@ -953,12 +1022,10 @@ class ManualService:
     def _detect_hallucination(self, keywords: list[str], source_text: str) -> bool:
         """모든 키워드가 원문에 존재하는지 검증 (간단한 환각 방지 규칙)."""
 
-        lowered = source_text.lower()
-        for keyword in keywords:
-            if keyword.lower() not in lowered:
-                logger.warning("hallucination_detected_keyword_absent", keyword=keyword)
-                return True
-        return False
+        ok, missing = validate_keywords_in_source(keywords, source_text)
+        for keyword in missing:
+            logger.warning("hallucination_detected_keyword_absent", keyword=keyword)
+        return not ok
 
     async def _persist_manual_entry(
         self,
@@ -1038,21 +1105,32 @@ class ManualService:
     ) -> str | None:
         """Diff JSON을 LLM을 통해 자연어 요약 (환각 방지 프롬프트 사용)."""
 
-        payload = {
-            "base_version": base_version,
-            "compare_version": compare_version,
-            "added_entries": [entry.model_dump() for entry in diff["added_entries"]],
-            "removed_entries": [entry.model_dump() for entry in diff["removed_entries"]],
-            "modified_entries": [entry.model_dump() for entry in diff["modified_entries"]],
-        }
-        prompt = build_manual_diff_summary_prompt(diff_json=json.dumps(payload, ensure_ascii=False))
+        # 변경 사항이 없으면 요약할 내용도 없으므로 LLM 호출 생략
+        if not (diff["added_entries"] or diff["removed_entries"] or diff["modified_entries"]):
+            return None
+
+        # 이미 검증된 스냅샷이므로 model_construct로 감싸고, 중간 dict(model_dump) 없이
+        # 한 번에 UTF-8 JSON으로 직렬화 (ensure_ascii=False와 동일)
+        payload = _DiffSummaryPayload.model_construct(
+            base_version=base_version,
+            compare_version=compare_version,
+            added_entries=diff["added_entries"],
+            removed_entries=diff["removed_entries"],
+            modified_entries=diff["modified_entries"],
+        )
+        diff_json = payload.model_dump_json()
+        prompt = build_manual_diff_summary_prompt(diff_json=diff_json)
         start = time.perf_counter()
         try:
-            response = await self.llm_client.complete(
-                prompt=prompt,
-                system_prompt=DIFF_SYSTEM_PROMPT,
-                temperature=0.0,
-                max_tokens=400,
+            # 요약은 부가 정보이므로 느린 LLM이 diff 응답을 붙잡지 않도록 시간 제한
+            response = await asyncio.wait_for(
+                self.llm_client.complete(
+                    prompt=prompt,
+                    system_prompt=DIFF_SYSTEM_PROMPT,
+                    temperature=0.0,
+                    max_tokens=400,
+                ),
+                timeout=settings.llm_summary_timeout_seconds,
             )
             latency_ms = (time.perf_counter() - start) * 1000
             log_llm_call(
@@ -1062,6 +1140,20 @@ class ManualService:
                 tokens=None,
             )
             return response.content.strip()
+        except asyncio.TimeoutError:
+            latency_ms = (time.perf_counter() - start) * 1000
+            logger.warning(
+                "manual_diff_summary_timeout",
+                timeout_seconds=settings.llm_summary_timeout_seconds,
+            )
+            log_llm_call(
+                operation="manual_diff_summary",
+                model=getattr(self.llm_client, "model", None),
+                latency_ms=latency_ms,
+                tokens=None,
+                error="timeout",
+            )
+            return None
         except Exception as exc:  # noqa: BLE001
             logger.warning("manual_diff_summary_failed", error=str(exc))
             latency_ms = (time.perf_counter() - start) * 1000
@@ -1081,36 +1173,46 @@ class ManualService:
     ) -> dict[str, list[Any]]:
         """ManualEntry 목록을 비교해 added/removed/modified를 구한다."""
 
-        base_map = {self._logical_key(entry): entry for entry in base_entries}
-        compare_map = {self._logical_key(entry): entry for entry in compare_entries}
+        return self._diff_keyed_entries(
+            self._key_by_logical_key(base_entries),
+            self._key_by_logical_key(compare_entries),
+        )
 
-        added_entries = [
-            self._to_snapshot(entry, logical_key=key)
-            for key, entry in compare_map.items()
-            if key not in base_map
-        ]
+    def _diff_keyed_entries(
+        self,
+        base_map: dict[str, ManualEntry],
+        compare_map: dict[str, ManualEntry],
+    ) -> dict[str, list[Any]]:
+        """논리 키 → 항목 매핑끼리 비교해 added/removed/modified를 구한다.
 
-        removed_entries = [
-            self._to_snapshot(entry, logical_key=key)
-            for key, entry in base_map.items()
-            if key not in compare_map
-        ]
+        compare 측은 한 번의 순회로 added/modified를 함께 분류하며,
+        결과 순서는 입력 순서를 따른다.
+        """
 
+        added_entries: list[ManualDiffEntrySnapshot] = []
         modified_entries: list[ManualModifiedEntry] = []
         for key, entry in compare_map.items():
-            if key not in base_map:
+            base_entry = base_map.get(key)
+            if base_entry is None:
+                added_entries.append(self._to_snapshot(entry, logical_key=key))
                 continue
-            changed_fields = self._diff_fields(base_map[key], entry)
+            changed_fields = self._diff_fields(base_entry, entry)
             if changed_fields:
                 modified_entries.append(
                     ManualModifiedEntry(
                         logical_key=key,
-                        before=self._to_snapshot(base_map[key], logical_key=key),
+                        before=self._to_snapshot(base_entry, logical_key=key),
                         after=self._to_snapshot(entry, logical_key=key),
                         changed_fields=changed_fields,
                     )
                 )
 
+        removed_entries = [
+            self._to_snapshot(entry, logical_key=key)
+            for key, entry in base_map.items()
+            if key not in compare_map
+        ]
+
         return {
             "added_entries": added_entries,
             "removed_entries": removed_entries,
@@ -1119,25 +1221,34 @@ class ManualService:
 
     def _apply_drafts_to_base(
         self,
-        base_entries: list[ManualEntry],
-        draft_entries: list[ManualEntry],
-    ) -> list[ManualEntry]:
-        """기존 승인 세트에 드래프트 변경분을 덮어씌운 후보 세트를 만든다."""
+        base_map: dict[str, ManualEntry],
+        draft_entries: Sequence[ManualEntry],
+    ) -> dict[str, ManualEntry]:
+        """기존 승인 세트(논리 키 매핑)에 드래프트 변경분을 덮어씌운 후보 세트를 만든다."""
 
-        merged = {self._logical_key(entry): entry for entry in base_entries}
+        merged = dict(base_map)
         for draft in draft_entries:
             merged[self._logical_key(draft)] = draft
-        return list(merged.values())
+        return merged
+
+    def _key_by_logical_key(self, entries: list[ManualEntry]) -> dict[str, ManualEntry]:
+        """논리 키 → 항목 매핑 (같은 키는 뒤 항목이 우선)."""
+
+        return {self._logical_key(entry): entry for entry in entries}
 
     def _logical_key(self, entry: ManualEntry) -> str:
         """업무구분/에러코드 기반 논리 키 생성 (없으면 topic까지 포함)."""
 
-        business = entry.business_type or "default"
-        error = entry.error_code or "none"
+        business_type = entry.business_type
+        error_code = entry.error_code
+        if business_type is not None or error_code is not None:
+            # 일반 경로: topic 정규화(strip/lower) 없이 바로 키 생성
+            return f"{business_type or 'default'}::{error_code or 'none'}"
+
         topic_part = (entry.topic or "").strip().lower()
-        if entry.business_type is None and entry.error_code is None and topic_part:
-            return f"{business}::{error}::{topic_part}"
-        return f"{business}::{error}"
+        if topic_part:
+            return f"default::none::{topic_part}"
+        return "default::none"
 
     def _to_snapshot(
         self,
@@ -1147,7 +1258,8 @@ class ManualService:
     ) -> ManualDiffEntrySnapshot:
         return ManualDiffEntrySnapshot(
             logical_key=logical_key or self._logical_key(entry),
-            keywords=list(entry.keywords or []),
+            # list[str] 검증이 새 리스트를 만들므로 별도 복사 불필요
+            keywords=entry.keywords or [],
             topic=entry.topic,
             background=entry.background,
             guideline=entry.guideline,
@@ -1159,15 +1271,15 @@ class ManualService:
         """변경된 필드 목록 계산."""
 
         changed: list[str] = []
-        fields = ("keywords", "topic", "background", "guideline")
-        for field in fields:
-            before = getattr(base, field, None)
-            after = getattr(compare, field, None)
-            if field == "keywords":
-                before = list(before or [])
-                after = list(after or [])
-            if before != after:
-                changed.append(field)
+        # keywords는 None과 빈 목록을 같게 본다 (list 비교는 원소 단위이므로 복사 불필요)
+        if (base.keywords or []) != (compare.keywords or []):
+            changed.append("keywords")
+        if base.topic != compare.topic:
+            changed.append("topic")
+        if base.background != compare.background:
+            changed.append("background")
+        if base.guideline != compare.guideline:
+            changed.append("guideline")
         return changed
 
     async def _resolve_versions_for_diff(
@@ -1186,16 +1298,14 @@ class ManualService:
             raise ValidationError("compare_version을 사용할 때는 base_version을 함께 지정하세요.")
 
         if base_version and compare_version:
-            base = await self.version_repo.get_by_version(
-                base_version,
-                business_type=business_type,
-                error_code=error_code,
-            )
-            compare = await self.version_repo.get_by_version(
-                compare_version,
+            # base/compare 버전을 한 번의 쿼리로 조회
+            found = await self.version_repo.get_by_versions(
+                [base_version, compare_version],
                 business_type=business_type,
                 error_code=error_code,
             )
+            base = found.get(base_version)
+            compare = found.get(compare_version)
             if base is None:
                 raise RecordNotFoundError(
                     f"Base version '{base_version}' not found in group {business_type}::{error_code}"
@@ -1216,18 +1326,16 @@ class ManualService:
                 raise RecordNotFoundError(
                     f"Base version '{base_version}' not found in group {business_type}::{error_code}"
                 )
-            latest = await self.version_repo.get_latest_version(
+            # 최신 버전과 (base가 최신일 때 필요한) 직전 버전을 한 번에 조회
+            versions = await self.version_repo.list_versions(
                 business_type=business_type,
                 error_code=error_code,
+                limit=2,
             )
-            if latest is None:
+            if not versions:
                 raise RecordNotFoundError("비교할 최신 버전이 없습니다.")
+            latest = versions[0]
             if latest.id == base.id:
-                versions = await self.version_repo.list_versions(
-                    business_type=business_type,
-                    error_code=error_code,
-                    limit=2,
-                )
                 if len(versions) < 2:
                     raise ValidationError("동일 버전을 비교할 수 없습니다. 다른 버전을 지정하세요.")
                 return versions[1], versions[0]
@@ -1277,13 +1385,31 @@ class ManualService:
             metrics_counter("vector_index_failure", target="manual")
 
     def _build_manual_text(self, manual: ManualEntry) -> str:
-        parts = [
-            "[키워드] " + ", ".join(manual.keywords or []),
-            f"[주제] {manual.topic}",
-            f"[배경] {manual.background}",
-            f"[가이드라인] {manual.guideline}",
-        ]
-        return "\n".join(parts)
+        """메뉴얼 검색/비교용 텍스트 생성.
+
+        같은 인스턴스에 대해 여러 번 호출되는 경로(승인 → 인덱싱 등)를 위해
+        필드 값이 그대로일 때는 인스턴스에 저장해둔 결과를 재사용한다.
+        """
+
+        signature = (
+            tuple(manual.keywords or ()),
+            manual.topic,
+            manual.background,
+            manual.guideline,
+        )
+        cached = manual.__dict__.get(_MANUAL_TEXT_CACHE_ATTR)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        keywords, topic, background, guideline = signature
+        text = (
+            f"[키워드] {', '.join(keywords)}\n"
+            f"[주제] {topic}\n"
+            f"[배경] {background}\n"
+            f"[가이드라인] {guideline}"
+        )
+        manual.__dict__[_MANUAL_TEXT_CACHE_ATTR] = (signature, text)
+        return text
 
     def _summarize_manual(self, manual: ManualEntry | None) -> str | None:
         if manual is None:
@@ -1293,15 +1419,14 @@ class ManualService:
     def _resolve_business_type(self, manual: ManualEntry | None) -> BusinessType | None:
         if manual is None or manual.business_type is None:
             return None
-        try:
-            return BusinessType(manual.business_type)
-        except ValueError:
+        business_type = _BUSINESS_TYPE_BY_VALUE.get(manual.business_type)
+        if business_type is None:
             logger.warning(
                 "unknown_business_type",
                 manual_id=str(manual.id),
                 business_type=manual.business_type,
             )
-            return None
+        return business_type
 
     @measure_latency("manual_search")
     async def search_manuals(self, params: ManualSearchParams) -> list[ManualSearchResult]:
@@ -1318,10 +1443,14 @@ class ManualService:
             if v is not None
         }
 
-        vector_results = await self.vectorstore.search(
-            query=params.query,
-            top_k=params.top_k,
-            metadata_filter=metadata_filter or None,
+        # 벡터 검색(별도 커넥션)과 business_type 공통코드 매핑 조회(세션)를 동시에 진행
+        vector_results, business_type_map = await asyncio.gather(
+            self.vectorstore.search(
+                query=params.query,
+                top_k=params.top_k,
+                metadata_filter=metadata_filter or None,
+            ),
+            self._get_business_type_map(),
         )
 
         # Apply similarity threshold filter
@@ -1367,34 +1496,16 @@ class ManualService:
             recency_weight_config={"weight": 0.05, "half_life_days": 30},
         )
 
-        # business_type 공통코드 매핑 조회 (한 번만)
-        business_type_items = await self.common_code_item_repo.get_by_group_code(
-            "BUSINESS_TYPE", is_active_only=True
+        manual_responses = await self._enrich_manual_entry_responses(
+            [item["item"] for item in reranked], business_type_map
         )
-        business_type_map = {
-            item.code_key: item.code_value for item in business_type_items
-        }
-
-        results = []
-        for item in reranked:
-            manual = item["item"]
-            manual_response = ManualEntryResponse.model_validate(manual)
-            
-            # business_type_name 추가
-            manual_response = manual_response.model_copy(
-                update={
-                    "business_type_name": business_type_map.get(manual.business_type)
-                }
-            )
-
-            results.append(
-                ManualSearchResult(
-                    manual=manual_response,
-                    similarity_score=item.get("reranked_score", item.get("score", 0.0)),
-                )
+        return [
+            ManualSearchResult(
+                manual=manual_response,
+                similarity_score=item.get("reranked_score", item.get("score", 0.0)),
             )
-
-        return results
+            for item, manual_response in zip(reranked, manual_responses)
+        ]
 
     async def update_manual(
         self,
@@ -1450,23 +1561,7 @@ class ManualService:
             new_status=manual.status.value,
         )
 
-        response = ManualEntryResponse.model_validate(manual)
-        
-        # business_type_name 조회 및 추가
-        if manual.business_type:
-            business_type_items = await self.common_code_item_repo.get_by_group_code(
-                "BUSINESS_TYPE", is_active_only=True
-            )
-            business_type_map = {
-                item.code_key: item.code_value for item in business_type_items
-            }
-            response = response.model_copy(
-                update={
-                    "business_type_name": business_type_map.get(manual.business_type)
-                }
-            )
-        
-        return response
+        return await self._enrich_manual_entry_response(manual)
 
     async def _create_review_task(
         self,
@@ -1479,6 +1574,7 @@ class ManualService:
         compare_version: str | None = None,
         reason: str = "auto_detected",
         auto_merged: bool = False,
+        candidate_ids: list[UUID] | None = None,
     ) -> ManualReviewTask:
         """
         리뷰 태스크 생성 (v2.1 확장)
@@ -1491,8 +1587,16 @@ class ManualService:
             similarity_score: 유사도 점수
             reason: 태스크 생성 사유
             auto_merged: SUPPLEMENT 경로에서 자동 병합했는지 여부
+            candidate_ids: 그룹 비교에 사용된 후보 ID (승인 가드 생략 판단용)
         """
-        reviewer_dept_id = await self._resolve_reviewer_department_id(consultation)
+        if auto_merged and comparison_type == ComparisonType.SUPPLEMENT:
+            # SUPPLEMENT 경로: LLM 자동 병합 호출을 검토 부서 조회(DB)와 동시에 진행
+            reviewer_dept_id, _ = await asyncio.gather(
+                self._resolve_reviewer_department_id(consultation),
+                self._call_llm_compare(old_entry, new_entry),
+            )
+        else:
+            reviewer_dept_id = await self._resolve_reviewer_department_id(consultation)
 
         task = ManualReviewTask(
             old_entry_id=old_entry.id if old_entry else None,
@@ -1504,10 +1608,10 @@ class ManualService:
             decision_reason=reason,
             reviewer_department_id=reviewer_dept_id,
         )
+        if candidate_ids is not None:
+            task.comparison_hash = self._comparison_hash(new_entry, candidate_ids)
 
         if auto_merged and comparison_type == ComparisonType.SUPPLEMENT:
-            # SUPPLEMENT 경로: LLM으로 자동 병합
-            diff_json, diff_text = await self._call_llm_compare(old_entry, new_entry)
             task.review_notes = (
                 f"Auto-merged via LLM. Old: {old_entry.id}, New: {new_entry.id}"
             )
@@ -1515,6 +1619,34 @@ class ManualService:
         await self.review_repo.create(task)
         return task
 
+    def _comparison_hash(self, manual: ManualEntry, candidate_ids: list[UUID]) -> str:
+        """초안 텍스트와 비교 후보 집합으로 승인 가드 fingerprint(sha256) 생성."""
+
+        digest = hashlib.sha256(self._build_manual_text(manual).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(",".join(sorted(str(cid) for cid in candidate_ids)).encode("ascii"))
+        return digest.hexdigest()
+
+    async def _is_comparison_unchanged(
+        self,
+        manual: ManualEntry,
+        review_task: ManualReviewTask,
+    ) -> bool:
+        """
+        초안 작성 시점 이후 초안 내용과 그룹 APPROVED 후보가 모두 그대로인지 확인.
+
+        둘 다 같다면 best match도 같으므로 임베딩 기반 재비교를 생략할 수 있다.
+        """
+        if not review_task.comparison_hash:
+            return False
+
+        candidates = await self.manual_repo.find_all_approved_by_group(
+            business_type=manual.business_type,
+            error_code=manual.error_code,
+        )
+        current_hash = self._comparison_hash(manual, [c.id for c in candidates])
+        return current_hash == review_task.comparison_hash
+
     async def _resolve_reviewer_department_id(
         self,
         consultation: Consultation,
@@ -1586,16 +1718,16 @@ class ManualService:
         similarity_score: float | None,
         approver_id: UUID,
     ) -> None:
-        event = {
-            "event_type": "manual_replaced",
-            "old_manual_id": str(old_manual_id),
-            "new_manual_id": str(new_manual_id),
-            "comparison_type": comparison_type.value,
-            "similarity_score": similarity_score,
-            "approver_id": str(approver_id),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-        logger.info("manual_replacement_event", **event)
+        logger.info(
+            "manual_replacement_event",
+            event_type="manual_replaced",
+            old_manual_id=str(old_manual_id),
+            new_manual_id=str(new_manual_id),
+            comparison_type=comparison_type.value,
+            similarity_score=similarity_score,
+            approver_id=str(approver_id),
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        )
 
     async def _enrich_manual_entry_response(
         self,
@@ -1607,29 +1739,74 @@ class ManualService:
 
         Args:
             entry: ManualEntry 객체
-            business_type_map: 공통코드 매핑 (선택사항, None이면 조회)
+            business_type_map: 공통코드 매핑 (선택사항, None이면 해당 코드만 조회)
 
         Returns:
             business_type_name이 포함된 ManualEntryResponse
         """
-        response = ManualEntryResponse.model_validate(entry)
+        if not entry.business_type:
+            return _to_manual_entry_response(entry)
 
-        if entry.business_type:
-            if not business_type_map:
-                business_type_items = await self.common_code_item_repo.get_by_group_code(
-                    "BUSINESS_TYPE", is_active_only=True
-                )
-                business_type_map = {
-                    item.code_key: item.code_value for item in business_type_items
-                }
-
-            response = response.model_copy(
-                update={
-                    "business_type_name": business_type_map.get(entry.business_type)
-                }
+        if business_type_map:
+            name = business_type_map.get(entry.business_type)
+        else:
+            # 단건은 전체 매핑 대신 해당 코드 하나만 조회
+            name = await self._lookup_business_type_name(entry.business_type)
+        return _to_manual_entry_response(entry, name)
+
+    async def _enrich_manual_entry_responses(
+        self,
+        entries: list[ManualEntry],
+        business_type_map: dict[str, str] | None = None,
+    ) -> list[ManualEntryResponse]:
+        """
+        여러 ManualEntry를 한 번에 ManualEntryResponse로 변환 (business_type_name 포함)
+
+        공통코드 매핑은 필요할 때 한 번만 조회하고, 이후 변환 루프에서는
+        await 없이 동기적으로 응답을 만든다.
+
+        Args:
+            entries: ManualEntry 목록
+            business_type_map: 공통코드 매핑 (선택사항, 없으면 필요 시 조회)
+
+        Returns:
+            entries 순서를 유지한 ManualEntryResponse 목록
+        """
+        type_map = business_type_map or {}
+        if not type_map and any(entry.business_type for entry in entries):
+            type_map = await self._get_business_type_map()
+
+        return [
+            _to_manual_entry_response(
+                entry,
+                type_map.get(entry.business_type) if entry.business_type else None,
             )
+            for entry in entries
+        ]
 
-        return response
+    async def _get_business_type_map(self) -> dict[str, str]:
+        """
+        BUSINESS_TYPE 공통코드 매핑(code_key -> code_value) 조회
+
+        자주 바뀌지 않는 조회 테이블이므로 공통코드 캐시(TTL)를 재사용한다.
+        """
+        return await get_common_code_map("BUSINESS_TYPE", self.common_code_item_repo)
+
+    async def _lookup_business_type_name(self, code_key: str) -> str | None:
+        """
+        단일 business_type 코드의 이름 조회
+
+        매핑 캐시가 유효하면 그대로 사용하고, 아니면 전체 그룹 대신
+        해당 항목 한 건만 조회한다.
+        """
+        cached = get_cached_common_code_map("BUSINESS_TYPE")
+        if cached is not None:
+            return cached.get(code_key)
+
+        item = await self.common_code_item_repo.get_by_key(
+            "BUSINESS_TYPE", code_key, is_active_only=True
+        )
+        return item.code_value if item is not None else None
 
     async def _get_business_type_name(self, manual: ManualEntry | None) -> str | None:
         """
@@ -1645,15 +1822,10 @@ class ManualService:
             return None
 
         try:
-            # BUSINESS_TYPE 그룹의 항목들 조회
-            items = await self.common_code_item_repo.get_by_group_code(
-                "BUSINESS_TYPE", is_active_only=True
-            )
-
-            # business_type 코드와 일치하는 항목 찾기
-            for item in items:
-                if item.code_key == manual.business_type:
-                    return item.code_value
+            # BUSINESS_TYPE에서 business_type 코드와 일치하는 항목 찾기
+            name = await self._lookup_business_type_name(manual.business_type)
+            if name is not None:
+                return name
 
             # 일치하는 항목이 없으면 None 반환
             logger.warning(
@@ -1682,7 +1854,7 @@ class ManualService:
         1. manual_id 존재 확인
         2. 상태가 DRAFT인지 확인 (DRAFT 상태에서만 삭제 가능)
         3. 벡터스토어에서 삭제
-        4. 관련 리뷰 태스크 삭제
+        4. 관련 리뷰 태스크 일괄 삭제 (3과 동시에 진행)
 
         Raises:
             RecordNotFoundError: 메뉴얼을 찾을 수 없음
@@ -1697,21 +1869,11 @@ class ManualService:
                 f"DRAFT 상태인 메뉴얼만 삭제 가능합니다. 현재 상태: {manual.status}"
             )
 
-        # 3. 벡터스토어에서 삭제 (실패해도 계속 진행)
-        if self.vectorstore:
-            try:
-                await self.vectorstore.delete(str(manual_id), "manual")
-            except Exception as e:
-                logger.warning(
-                    "failed_to_delete_from_vectorstore",
-                    manual_id=str(manual_id),
-                    error=str(e),
-                )
-
-        # 4. 관련 리뷰 태스크 삭제
-        review_tasks = await self.review_repo.find_by_manual_id(manual_id)
-        for task in review_tasks:
-            await self.review_repo.delete(task)
+        # 3. 벡터스토어 삭제(별도 커넥션)와 4. 관련 리뷰 태스크 일괄 삭제(세션)를 동시에 진행
+        await asyncio.gather(
+            self._delete_manual_vector(manual_id),
+            self.review_repo.delete_by_manual_id(manual_id),
+        )
 
         # 5. 메뉴얼 삭제
         await self.manual_repo.delete(manual)
@@ -1725,6 +1887,20 @@ class ManualService:
         )
 
 
+    async def _delete_manual_vector(self, manual_id: UUID) -> None:
+        """벡터스토어에서 메뉴얼 문서 삭제 (실패해도 계속 진행)."""
+
+        if not self.vectorstore:
+            return
+        try:
+            await self.vectorstore.delete_document(manual_id)
+        except Exception as e:
+            logger.warning(
+                "failed_to_delete_from_vectorstore",
+                manual_id=str(manual_id),
+                error=str(e),
+            )
+
     async def get_review_tasks_by_manual_id(
         self,
         manual_id: UUID,
@@ -1744,20 +1920,19 @@ class ManualService:
         review_repo = ManualReviewTaskRepository(self.session)
         reviewer_department_ids: list[UUID] | None = None
         if current_user.role != UserRole.ADMIN:
-            department_ids = get_user_department_ids(current_user)
-            reviewer_department_ids = department_ids or None
-
-        tasks = await review_repo.find_by_manual_id_with_entries(
+            reviewer_department_ids = get_user_department_ids(current_user)
+            if not reviewer_department_ids:
+                # 소속 부서가 없으면 볼 수 있는 태스크가 없으므로 존재 여부만 확인
+                if await review_repo.exists_by_manual_id(manual_id):
+                    raise AuthorizationError("해당 메뉴얼 검토 태스크를 조회할 권한이 없습니다.")
+                return []
+
+        # 부서 가시성 조건은 SQL에서 적용되므로 결과를 그대로 사용
+        visible_tasks = await review_repo.find_by_manual_id_with_entries(
             manual_id,
             reviewer_department_ids=reviewer_department_ids,
         )
 
-        visible_tasks = (
-            tasks if current_user.role == UserRole.ADMIN else filter_tasks_for_user(current_user, tasks)
-        )
-        if tasks and not visible_tasks:
-            raise AuthorizationError("해당 메뉴얼 검토 태스크를 조회할 권한이 없습니다.")
-
         if not visible_tasks:
             return []
 
@@ -1767,12 +1942,7 @@ class ManualService:
             return []
 
         # Get business type name for new entry
-        business_type_items = await self.common_code_item_repo.get_by_group_code(
-            "BUSINESS_TYPE", is_active_only=True
-        )
-        business_type_map = {
-            item.code_key: item.code_value for item in business_type_items
-        }
+        business_type_map = await self._get_business_type_map()
 
         result = []
         for task in visible_tasks:
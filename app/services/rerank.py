@@ -7,7 +7,13 @@ Vector 유사도 점수에 도메인 메타(업무/에러)와 최신성 가중
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+
+_SECONDS_PER_DAY = 86400.0
+# metadata가 없는 결과에 쓰는 읽기 전용 빈 매핑 (결과마다 새 dict를 만들지 않음)
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
 
 def _parse_datetime(value: Any) -> datetime | None:
@@ -15,10 +21,12 @@ def _parse_datetime(value: Any) -> datetime | None:
         return None
     if isinstance(value, datetime):
         return value
-    try:
-        return datetime.fromisoformat(str(value))
-    except Exception:  # noqa: BLE001
-        return None
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
 
 
 def _to_utc(dt: datetime) -> datetime:
@@ -44,6 +52,9 @@ def rerank_results(
         "score": float,  # vector similarity
         "metadata": {"business_type": str | None, "error_code": str | None, "created_at": datetime | str | None}
     }
+
+    입력 dict에 reranked_score/domain_bonus/recency_bonus를 직접 기록해 재사용한다
+    (호출자는 이 함수만을 위해 만든 dict를 넘긴다).
     """
 
     domain_cfg = domain_weight_config or {}
@@ -55,37 +66,37 @@ def rerank_results(
 
     recency_weight = float(recency_cfg.get("weight", 0.05))
     half_life_days = float(recency_cfg.get("half_life_days", 30))
+    # 루프 불변값: 경과 초 → 반감기 단위 환산 계수 (나눗셈 대신 곱셈)
+    # 최신성 보너스는 지수 감쇠: half_life_days가 지나면 정확히 절반이 된다.
+    inv_half_life_seconds = 1.0 / (max(half_life_days, 1.0) * _SECONDS_PER_DAY)
 
     reranked: list[dict] = []
     now_utc = datetime.now(timezone.utc)
 
     for result in results:
-        metadata = result.get("metadata") or {}
+        metadata_get = (result.get("metadata") or _EMPTY_METADATA).get
         base_score = float(result.get("score", 0.0))
 
         domain_bonus = 0.0
-        if bt_expected and metadata.get("business_type") == bt_expected:
+        if bt_expected and metadata_get("business_type") == bt_expected:
             domain_bonus += bt_weight
-        if ec_expected and metadata.get("error_code") == ec_expected:
+        if ec_expected and metadata_get("error_code") == ec_expected:
             domain_bonus += ec_weight
 
         recency_bonus = 0.0
-        created_at = _parse_datetime(metadata.get("created_at"))
+        created_at = _parse_datetime(metadata_get("created_at"))
         if created_at:
-            created_at_utc = _to_utc(created_at)
-            age_days = max((now_utc - created_at_utc).total_seconds() / 86400, 0.0)
-            recency_bonus = recency_weight / (1 + age_days / max(half_life_days, 1))
+            age_seconds = max((now_utc - _to_utc(created_at)).total_seconds(), 0.0)
+            recency_bonus = recency_weight * 2.0 ** (-age_seconds * inv_half_life_seconds)
 
         final_score = base_score + domain_bonus + recency_bonus
         # Clamp to valid [0,1] range expected by schemas
         final_score = max(0.0, min(final_score, 1.0))
 
-        reranked.append({
-            **result,
-            "reranked_score": final_score,
-            "domain_bonus": domain_bonus,
-            "recency_bonus": recency_bonus,
-        })
+        result["reranked_score"] = final_score
+        result["domain_bonus"] = domain_bonus
+        result["recency_bonus"] = recency_bonus
+        reranked.append(result)
 
-    reranked.sort(key=lambda x: x.get("reranked_score", x.get("score", 0.0)), reverse=True)
+    reranked.sort(key=itemgetter("reranked_score"), reverse=True)
     return reranked
@@ -9,12 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.core.security import hash_password, verify_password
 from app.models.department import Department
-from app.models.user import UserRole
+from app.models.user import User, UserRole
 from app.repositories.department_repository import DepartmentRepository
 from app.repositories.user_repository import UserRepository
-from app.schemas.department import UserDepartmentAssignment
 from app.schemas.user import UserCreate
-from app.services.department_service import DepartmentService
 
 
 logger = get_logger(__name__)
@@ -33,12 +31,10 @@ class SystemBootstrapService:
         *,
         user_repo: UserRepository | None = None,
         department_repo: DepartmentRepository | None = None,
-        department_service: DepartmentService | None = None,
     ) -> None:
         self.session = session
         self.user_repo = user_repo or UserRepository(session)
         self.department_repo = department_repo or DepartmentRepository(session)
-        self.department_service = department_service or DepartmentService(session)
 
     async def ensure_system_admin(self, admin_id: str, admin_password: str) -> None:
         logger.info("system_admin_bootstrap_start", employee_id=admin_id)
@@ -68,6 +64,8 @@ class SystemBootstrapService:
 
         if updated_fields:
             await self.user_repo.update_user(user)
+            # update_user의 refresh는 부서 링크를 만료시키므로, 링크만 다시 로딩
+            await self.session.refresh(user, attribute_names=["department_links"])
             logger.info(
                 "system_admin_user_updated",
                 employee_id=admin_id,
@@ -76,7 +74,7 @@ class SystemBootstrapService:
         else:
             logger.info("system_admin_user_no_change", employee_id=admin_id)
 
-        await self._ensure_admin_department_link(user.id, department.id, admin_id)
+        await self._ensure_admin_department_link(user, department.id, admin_id)
 
     async def _ensure_system_department(self) -> Department:
         logger.info(
@@ -127,25 +125,17 @@ class SystemBootstrapService:
         hashed_password = hash_password(admin_password)
         user = await self.user_repo.create_user(user_create, password_hash=hashed_password)
 
-        assignment = UserDepartmentAssignment(
-            department_ids=[department_id],
-            primary_department_id=department_id,
+        await self.department_repo.link_user_department_if_missing(
+            user.id, department_id, is_primary=True
         )
-        await self.department_service.assign_user_departments(user.id, assignment)
 
     async def _ensure_admin_department_link(
         self,
-        user_id: int,
+        user: User,
         department_id: UUID,
         admin_id: str,
     ) -> None:
-        user = await self.user_repo.get_with_departments(user_id)
-        if user is None:
-            logger.info("system_admin_department_skip_missing_user", employee_id=admin_id)
-            return
-
-        department_ids = [link.department_id for link in user.department_links]
-        if department_id in department_ids:
+        if any(link.department_id == department_id for link in user.department_links):
             logger.info(
                 "system_admin_department_exists",
                 employee_id=admin_id,
@@ -158,16 +148,12 @@ class SystemBootstrapService:
             employee_id=admin_id,
             department_code=self.SYSTEM_DEPARTMENT_CODE,
         )
-        department_ids.append(department_id)
-        primary_department_id = next(
-            (link.department_id for link in user.department_links if link.is_primary),
+        # 기존 링크는 그대로 두고 시스템 부서 링크만 추가 (주 부서가 없으면 주 부서로 지정)
+        await self.department_repo.link_user_department_if_missing(
+            user.id,
             department_id,
+            is_primary=not any(link.is_primary for link in user.department_links),
         )
-        assignment = UserDepartmentAssignment(
-            department_ids=department_ids,
-            primary_department_id=primary_department_id,
-        )
-        await self.department_service.assign_user_departments(user.id, assignment)
         logger.info(
             "system_admin_department_linked",
             employee_id=admin_id,
@@ -6,6 +6,7 @@ ManualReviewTask 승인/반려 및 히스토리 기록을 담당한다.
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Sequence
 from uuid import UUID
 
@@ -28,9 +29,11 @@ from app.repositories.common_code_rdb import CommonCodeItemRepository
 from app.schemas.manual import (
     ManualApproveRequest,
     ManualReviewApproval,
+    ManualReviewBulkApproval,
     ManualReviewRejection,
     ManualReviewTaskResponse,
 )
+from app.services.common_code_cache import get_common_code_map
 from app.services.manual_service import ManualService
 from app.core.logging import metrics_counter
 
@@ -80,7 +83,7 @@ class TaskService:
             limit=limit,
         )
 
-        return [await self._to_response(task) for task in tasks]
+        return await self._to_responses(tasks)
 
     async def approve_task(
         self,
@@ -114,6 +117,57 @@ class TaskService:
 
         return await self._to_response(task)
 
+    async def bulk_approve_tasks(
+        self,
+        payload: ManualReviewBulkApproval,
+        current_user: User,
+    ) -> list[ManualReviewTaskResponse]:
+        """여러 검토 태스크 일괄 승인
+
+        상태 변경 이력과 태스크 변경은 한 번의 flush로 반영하고, 메뉴얼 승인은 태스크별로 처리한다.
+
+        Raises:
+            RecordNotFoundError: 존재하지 않는 태스크가 포함되었을 때
+        """
+        task_ids = list(dict.fromkeys(payload.task_ids))
+        tasks_by_id = {task.id: task for task in await self.task_repo.find_by_ids(task_ids)}
+        missing_ids = [task_id for task_id in task_ids if task_id not in tasks_by_id]
+        if missing_ids:
+            raise RecordNotFoundError(
+                f"ManualReviewTask(ids={[str(task_id) for task_id in missing_ids]}) not found"
+            )
+
+        tasks = [tasks_by_id[task_id] for task_id in task_ids]
+        for task in tasks:
+            ensure_user_can_modify_task(current_user, task)
+
+        # 이력은 변경 전 상태로 먼저 만들고, 태스크 변경과 함께 한 번에 flush
+        self._add_history_many(
+            [(task, TaskStatus.DONE) for task in tasks],
+            changed_by=payload.employee_id,
+            reason=payload.review_notes,
+        )
+
+        # updated_at을 직접 지정해 flush 후 만료/refresh 없이 응답을 만든다
+        now = datetime.now(timezone.utc)
+        for task in tasks:
+            task.status = TaskStatus.DONE
+            task.reviewer_id = payload.employee_id
+            task.review_notes = payload.review_notes
+            task.updated_at = now
+        await self.session.flush()
+
+        approve_request = ManualApproveRequest(
+            approver_id=payload.employee_id, notes=payload.review_notes
+        )
+        for task in tasks:
+            await self.manual_service.approve_manual(
+                manual_id=task.new_entry_id,
+                request=approve_request,
+            )
+
+        return await self._to_responses(tasks)
+
     async def reject_task(
         self,
         task_id: UUID,
@@ -192,20 +246,98 @@ class TaskService:
         metrics_counter("task_status_change", to_status=to_status.value)
         return history
 
+    def _add_history_many(
+        self,
+        entries: Sequence[tuple[ManualReviewTask, TaskStatus]],
+        *,
+        changed_by: str | None = None,
+        reason: str | None = None,
+    ) -> list[TaskHistory]:
+        """여러 태스크의 상태 변경 이력을 세션에 추가 (flush는 호출자가 한 번에 수행)"""
+
+        histories = [
+            TaskHistory(
+                task_id=task.id,
+                from_status=task.status,
+                to_status=to_status,
+                changed_by=changed_by,
+                reason=reason,
+            )
+            for task, to_status in entries
+        ]
+        if not histories:
+            return histories
+
+        self.session.add_all(histories)
+        logger.info(
+            "task_status_change_batch",
+            count=len(histories),
+            task_ids=[str(history.task_id) for history in histories],
+            to_statuses=sorted({history.to_status.value for history in histories}),
+            changed_by=str(changed_by) if changed_by else None,
+        )
+        for history in histories:
+            metrics_counter("task_status_change", to_status=history.to_status.value)
+        return histories
+
     async def _to_response(self, task: ManualReviewTask) -> ManualReviewTaskResponse:
-        old_manual = self._get_loaded_relation(task, "old_entry")
-        if old_manual is None and task.old_entry_id:
-            old_manual = await self.manual_repo.get_by_id(task.old_entry_id)
+        responses = await self._to_responses([task])
+        return responses[0]
 
-        new_manual = self._get_loaded_relation(task, "new_entry")
-        if new_manual is None:
-            new_manual = await self.manual_repo.get_by_id(task.new_entry_id)
+    async def _to_responses(
+        self, tasks: Sequence[ManualReviewTask]
+    ) -> list[ManualReviewTaskResponse]:
+        """
+        여러 태스크를 한 번에 응답으로 변환
 
-        # 신규 메뉴얼 business_type 정보 조회
-        new_business_type_name = await self._get_business_type_name(new_manual)
-        # 기존 메뉴얼 business_type 정보 조회
-        old_business_type_name = await self._get_business_type_name(old_manual)
+        로드되지 않은 old/new 메뉴얼은 한 번의 IN 쿼리로, BUSINESS_TYPE 공통코드는
+        한 번만 조회한 뒤 메모리 매핑으로 응답을 만든다 (태스크 수와 무관한 쿼리 수).
+        """
+        if not tasks:
+            return []
+
+        manuals: dict[UUID, ManualEntry] = {}
+        missing_ids: set[UUID] = set()
+        for task in tasks:
+            for attr_name, entry_id in (
+                ("old_entry", task.old_entry_id),
+                ("new_entry", task.new_entry_id),
+            ):
+                if entry_id is None:
+                    continue
+                loaded = self._get_loaded_relation(task, attr_name)
+                if loaded is not None:
+                    manuals[entry_id] = loaded
+                else:
+                    missing_ids.add(entry_id)
+
+        missing_ids -= manuals.keys()
+        if missing_ids:
+            for manual in await self.manual_repo.find_by_ids(list(missing_ids)):
+                manuals[manual.id] = manual
+
+        business_type_map: dict[str, str] = {}
+        if any(manual.business_type for manual in manuals.values()):
+            business_type_map = await self._get_business_type_map()
+
+        return [
+            self._build_response(
+                task,
+                old_manual=manuals.get(task.old_entry_id) if task.old_entry_id else None,
+                new_manual=manuals.get(task.new_entry_id),
+                business_type_map=business_type_map,
+            )
+            for task in tasks
+        ]
 
+    def _build_response(
+        self,
+        task: ManualReviewTask,
+        *,
+        old_manual: ManualEntry | None,
+        new_manual: ManualEntry | None,
+        business_type_map: dict[str, str],
+    ) -> ManualReviewTaskResponse:
         return ManualReviewTaskResponse(
             id=task.id,
             created_at=task.created_at,
@@ -223,13 +355,13 @@ class TaskService:
             diff_json=None,
             # 신규 메뉴얼 정보
             business_type=new_manual.business_type if new_manual else None,
-            business_type_name=new_business_type_name,
+            business_type_name=self._lookup_business_type_name(new_manual, business_type_map),
             new_error_code=new_manual.error_code if new_manual else None,
             new_manual_topic=new_manual.topic if new_manual else None,
             new_manual_keywords=new_manual.keywords if new_manual else None,
             # 기존 메뉴얼 정보 (old_entry_id가 있을 때만)
             old_business_type=old_manual.business_type if old_manual else None,
-            old_business_type_name=old_business_type_name,
+            old_business_type_name=self._lookup_business_type_name(old_manual, business_type_map),
             old_error_code=old_manual.error_code if old_manual else None,
             old_manual_topic=old_manual.topic if old_manual else None,
         )
@@ -245,12 +377,26 @@ class TaskService:
             return None
         return f"{manual.topic} | {manual.background[:80]}" if manual.background else manual.topic
 
-    async def _get_business_type_name(self, manual: ManualEntry | None) -> str | None:
+    async def _get_business_type_map(self) -> dict[str, str]:
+        """BUSINESS_TYPE 공통코드 매핑(code_key -> code_value) 조회 (실패 시 빈 매핑)."""
+
+        try:
+            return await get_common_code_map("BUSINESS_TYPE", self.common_code_item_repo)
+        except Exception as e:
+            logger.warning("error_getting_business_type_map", error=str(e))
+            return {}
+
+    def _lookup_business_type_name(
+        self,
+        manual: ManualEntry | None,
+        business_type_map: dict[str, str],
+    ) -> str | None:
         """
-        공통코드에서 business_type의 이름(code_value)을 조회
+        공통코드 매핑에서 business_type의 이름(code_value)을 조회
 
         Args:
             manual: ManualEntry 또는 None
+            business_type_map: BUSINESS_TYPE 공통코드 매핑
 
         Returns:
             업무구분 이름 (예: "인터넷뱅킹") 또는 None
@@ -258,29 +404,11 @@ class TaskService:
         if manual is None or manual.business_type is None:
             return None
 
-        try:
-            # BUSINESS_TYPE 그룹의 항목들 조회
-            items = await self.common_code_item_repo.get_by_group_code(
-                "BUSINESS_TYPE", is_active_only=True
-            )
-
-            # business_type 코드와 일치하는 항목 찾기
-            for item in items:
-                if item.code_key == manual.business_type:
-                    return item.code_value
-
-            # 일치하는 항목이 없으면 None 반환
+        name = business_type_map.get(manual.business_type)
+        if name is None:
             logger.warning(
                 "business_type_not_found_in_common_code",
                 manual_id=str(manual.id),
                 business_type=manual.business_type,
             )
-            return None
-        except Exception as e:
-            logger.warning(
-                "error_getting_business_type_name",
-                manual_id=str(manual.id),
-                business_type=manual.business_type,
-                error=str(e),
-            )
-            return None
+        return name
@@ -2,13 +2,16 @@
 Admin user management service
 """
 
-import re
+import asyncio
+import string
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import DuplicateRecordError, RecordNotFoundError, ValidationError
 from app.core.security import hash_password
+from app.models.user import User
 from app.repositories.user_repository import UserRepository
-from app.schemas.department import UserDepartmentAssignment
+from app.schemas.department import DepartmentResponse, UserDepartmentAssignment
 from app.schemas.user import (
     UserAdminCreate,
     UserAdminUpdate,
@@ -19,6 +22,33 @@ from app.schemas.user import (
 )
 from app.services.department_service import DepartmentService
 
+# ORM에서 그대로 옮겨 담는 응답 필드
+_USER_RESPONSE_FIELDS = tuple(name for name in UserResponse.model_fields if name != "departments")
+_DEPARTMENT_RESPONSE_FIELDS = tuple(DepartmentResponse.model_fields)
+
+
+def _to_user_response(user: User) -> UserResponse:
+    """DB에서 읽은 User를 검증 없이 UserResponse로 변환 (목록 조회용).
+
+    스키마 검증은 라우터의 response_model 경계에서 수행되므로 목록 변환은
+    model_construct로 행마다의 재검증 비용을 생략한다.
+    """
+
+    values = {name: getattr(user, name) for name in _USER_RESPONSE_FIELDS}
+    values["departments"] = [
+        DepartmentResponse.model_construct(
+            **{name: getattr(department, name) for name in _DEPARTMENT_RESPONSE_FIELDS}
+        )
+        for department in user.departments
+    ]
+    return UserResponse.model_construct(**values)
+
+
+# 비밀번호 정책 문자 분류 (영문 대/소문자, 그 외 영숫자가 아닌 문자는 특수문자)
+_UPPER_CHARS = frozenset(string.ascii_uppercase)
+_LOWER_CHARS = frozenset(string.ascii_lowercase)
+_ALNUM_CHARS = frozenset(string.ascii_letters + string.digits)
+
 
 class UserAdminService:
     """관리자용 사용자 조회/생성/수정 서비스."""
@@ -45,7 +75,7 @@ class UserAdminService:
             department_code=params.department_code,
         )
 
-        return [UserResponse.model_validate(user) for user in users]
+        return [_to_user_response(user) for user in users]
 
     async def search_users(self, params: UserSearchParams) -> list[UserResponse]:
         users = await self.user_repo.list_users(
@@ -55,7 +85,7 @@ class UserAdminService:
             is_active=params.is_active,
             department_code=params.department_code,
         )
-        return [UserResponse.model_validate(user) for user in users]
+        return [_to_user_response(user) for user in users]
 
     async def create_user(self, payload: UserAdminCreate) -> UserResponse:
         await self._enforce_password_policy(payload.password)
@@ -76,20 +106,19 @@ class UserAdminService:
             primary_department_id=payload.primary_department_id,
         )
 
-        hashed_password = hash_password(user_create.password)
+        # PBKDF2 해싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        hashed_password = await asyncio.to_thread(hash_password, user_create.password)
         new_user = await self.user_repo.create_user(user_create, password_hash=hashed_password)
 
         assignment = UserDepartmentAssignment(
             department_ids=payload.department_ids,
             primary_department_id=payload.primary_department_id,
         )
+        # assign_user_departments가 같은 세션에서 부서 링크를 eager 로딩(populate_existing)하므로
+        # identity map의 new_user에 이미 반영되어 별도 재조회가 필요 없다
         await self.department_service.assign_user_departments(new_user.id, assignment)
 
-        user_with_departments = await self.user_repo.get_with_departments(new_user.id)
-        if user_with_departments is None:
-            raise RecordNotFoundError(f"사용자(id={new_user.id})을(를) 찾을 수 없습니다.")
-
-        return UserResponse.model_validate(user_with_departments)
+        return UserResponse.model_validate(new_user)
 
     async def update_user(self, user_id: int, payload: UserAdminUpdate) -> UserResponse:
         user = await self.user_repo.get_with_departments(user_id)
@@ -98,7 +127,7 @@ class UserAdminService:
 
         if payload.password is not None:
             await self._enforce_password_policy(payload.password)
-            user.password_hash = hash_password(payload.password)
+            user.password_hash = await asyncio.to_thread(hash_password, payload.password)
 
         if payload.name is not None:
             user.name = payload.name
@@ -116,15 +145,11 @@ class UserAdminService:
                 department_ids=payload.department_ids,
                 primary_department_id=payload.primary_department_id,
             )
+            # 새 부서 링크는 assign_user_departments의 재조회(populate_existing)로 user에 반영된다
             await self.department_service.assign_user_departments(user.id, assignment)
-            user = await self.user_repo.get_with_departments(user.id)
-            if user is None:
-                raise RecordNotFoundError(f"user_id={user.id}에 해당하는 사용자가 없습니다.")
         else:
-            refreshed = await self.user_repo.get_with_departments(user.id)
-            if refreshed is None:
-                raise RecordNotFoundError(f"user_id={user.id}에 해당하는 사용자가 없습니다.")
-            user = refreshed
+            # update_user의 refresh는 컬럼만 다시 읽고 부서 링크는 만료시키므로, 링크만 다시 로딩
+            await self.session.refresh(user, attribute_names=["department_links"])
         return UserResponse.model_validate(user)
 
     async def delete_user(self, user_id: int) -> None:
@@ -140,11 +165,14 @@ class UserAdminService:
                 f"비밀번호는 최소 {self._PASSWORD_MIN_LENGTH}자 이상이어야 합니다."
             )
 
-        if not re.search(r"[A-Z]", password):
+        # 문자열을 한 번만 순회해 문자 집합을 만들고, 각 조건은 집합 연산으로 확인
+        chars = set(password)
+
+        if chars.isdisjoint(_UPPER_CHARS):
             raise ValidationError("비밀번호에는 최소 1개의 영어 대문자가 포함되어야 합니다.")
 
-        if not re.search(r"[a-z]", password):
+        if chars.isdisjoint(_LOWER_CHARS):
             raise ValidationError("비밀번호에는 최소 1개의 영어 소문자가 포함되어야 합니다.")
 
-        if not re.search(r"[^A-Za-z0-9]", password):
+        if chars <= _ALNUM_CHARS:
             raise ValidationError("비밀번호에는 최소 1개의 특수문자가 포함되어야 합니다.")
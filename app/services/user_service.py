@@ -4,6 +4,8 @@ User service
 FastAPI에 의존하지 않는 순수 비즈니스 로직.
 """
 
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
@@ -41,12 +43,14 @@ class UserService:
     async def signup(self, user_create: UserCreate) -> UserResponse:
         """회원가입 수행."""
 
-        existing = await self.repository.get_by_employee_id(user_create.employee_id)
-        if existing is not None:
+        # PBKDF2 해싱/검증은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        password_hash = await asyncio.to_thread(hash_password, user_create.password)
+        # 중복 확인과 생성을 한 문장으로 처리해 동시 가입 경쟁 조건도 막는다
+        user = await self.repository.create_user_if_absent(
+            user_create, password_hash=password_hash
+        )
+        if user is None:
             raise DuplicateRecordError("Employee ID already exists")
-
-        password_hash = hash_password(user_create.password)
-        user = await self.repository.create_user(user_create, password_hash=password_hash)
         if not user_create.department_ids:
             raise ValidationError("적어도 하나의 부서를 지정해야 합니다.")
 
@@ -70,7 +74,7 @@ class UserService:
         if user is None:
             raise AuthenticationError("Invalid credentials")
 
-        if not verify_password(user_login.password, user.password_hash):
+        if not await asyncio.to_thread(verify_password, user_login.password, user.password_hash):
             raise AuthenticationError("Invalid credentials")
 
         payload = {
@@ -6,31 +6,48 @@ LLM 출력이 원문을 벗어나지 않는지 키워드/문장 단위로 검증
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Iterable
 
 
+@lru_cache(maxsize=8)
+def _lowered(text: str) -> str:
+    # 같은 원문에 대해 키워드/배경/조치 검증이 연달아 호출되므로 소문자 변환을 재사용
+    return text.lower()
+
+
 def validate_keywords_in_source(keywords: Iterable[str], source_text: str) -> tuple[bool, list[str]]:
-    """모든 키워드가 원문에 포함되는지 검사."""
+    """모든 키워드가 원문에 포함되는지 검사 (부분 문자열 기준, 대소문자 무시)."""
 
-    lowered = source_text.lower()
+    lowered = _lowered(source_text)
     missing: list[str] = []
+    # 같은 키워드(대소문자 무시)는 원문을 한 번만 스캔
+    checked: dict[str, bool] = {}
     for kw in keywords:
-        if kw and kw.lower() not in lowered:
+        if not kw:
+            continue
+        key = kw.lower()
+        found = checked.get(key)
+        if found is None:
+            found = checked[key] = key in lowered
+        if not found:
             missing.append(kw)
     return len(missing) == 0, missing
 
 
+# 문장 구분자(마침표/느낌표/물음표)를 줄바꿈으로 바꾸는 변환 테이블
+_SENTENCE_DELIMITERS = str.maketrans({c: "\n" for c in ".!?"})
+
+
 def _split_sentences(text: str) -> list[str]:
-    # 간단한 문장 분리: 마침표/느낌표/물음표/줄바꿈 기준
-    parts = re.split(r"[\.!?\n]+", text)
-    return [p.strip() for p in parts if p.strip()]
+    # 간단한 문장 분리: 마침표/느낌표/물음표/줄바꿈 기준 (정규식 없이 translate + split)
+    return [p for part in text.translate(_SENTENCE_DELIMITERS).split("\n") if (p := part.strip())]
 
 
 def validate_sentences_subset_of_source(sentences_text: str, source_text: str) -> tuple[bool, list[str]]:
     """문장들이 원문 서브셋인지 검사."""
 
-    source_lower = source_text.lower()
+    source_lower = _lowered(source_text)
     missing: list[str] = []
     for sent in _split_sentences(sentences_text):
         if sent.lower() not in source_lower:
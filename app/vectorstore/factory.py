@@ -3,6 +3,7 @@ VectorStore Factory
 Creates appropriate VectorStore implementation based on configuration
 """
 
+from functools import cache
 from typing import Literal
 
 from app.vectorstore.protocol import VectorStoreProtocol
@@ -19,12 +20,16 @@ CONSULTATION_INDEX = "consultations"
 MANUAL_INDEX = "manuals"
 
 
+@cache
 def get_vectorstore(
     index_name: Literal["consultations", "manuals"],
 ) -> VectorStoreProtocol:
     """
     Get VectorStore implementation based on configuration
 
+    Instances are memoized per index name, so every caller shares one
+    VectorStore (and its connection pool) per index.
+
     Args:
         index_name: Name of the index to use
 
@@ -66,11 +71,6 @@ def get_vectorstore(
     )
 
 
-# Singleton instances for dependency injection
-_consultation_vectorstore: VectorStoreProtocol | None = None
-_manual_vectorstore: VectorStoreProtocol | None = None
-
-
 def get_consultation_vectorstore() -> VectorStoreProtocol:
     """
     Get singleton Consultation VectorStore instance
@@ -78,10 +78,7 @@ def get_consultation_vectorstore() -> VectorStoreProtocol:
     Returns:
         VectorStore for consultations
     """
-    global _consultation_vectorstore
-    if _consultation_vectorstore is None:
-        _consultation_vectorstore = get_vectorstore(CONSULTATION_INDEX)
-    return _consultation_vectorstore
+    return get_vectorstore(CONSULTATION_INDEX)
 
 
 def get_manual_vectorstore() -> VectorStoreProtocol:
@@ -91,7 +88,4 @@ def get_manual_vectorstore() -> VectorStoreProtocol:
     Returns:
         VectorStore for manuals
     """
-    global _manual_vectorstore
-    if _manual_vectorstore is None:
-        _manual_vectorstore = get_vectorstore(MANUAL_INDEX)
-    return _manual_vectorstore
+    return get_vectorstore(MANUAL_INDEX)
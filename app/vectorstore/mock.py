@@ -12,7 +12,8 @@ Reference: Unit Specification v1.1
 
 from uuid import UUID
 from typing import Dict
-import asyncio
+
+import numpy as np
 
 from app.vectorstore.protocol import VectorSearchResult
 from app.core.exceptions import VectorIndexError, VectorSearchError
@@ -43,6 +44,11 @@ class MockVectorStore:
         """
         self.index_name = index_name
         self._storage: Dict[UUID, tuple[str, dict | None]] = {}
+        # 문서 임베딩은 색인 시 한 번만 계산해 검색마다 재계산하지 않는다
+        self._embeddings: Dict[UUID, list[float]] = {}
+        # 검색용 (N, D) float32 행렬: 쓰기 시 무효화하고 다음 검색에서 한 번만 다시 쌓는다
+        self._matrix: np.ndarray | None = None
+        self._matrix_ids: list[UUID] = []
         self.embedding_service = get_embedding_service()
         logger.info("mock_vectorstore_initialized", index_name=index_name)
 
@@ -61,10 +67,12 @@ class MockVectorStore:
             metadata: Optional metadata
         """
         try:
-            # Simulate async operation
-            await asyncio.sleep(0.01)
+            # Embed document once at index time using "passage:" prefix
+            embedding = await self.embedding_service.embed_passage(text)
 
             self._storage[id] = (text, metadata)
+            self._embeddings[id] = embedding
+            self._matrix = None
             logger.debug(
                 "document_indexed",
                 index=self.index_name,
@@ -75,11 +83,39 @@ class MockVectorStore:
             logger.error("index_error", error=str(e), doc_id=str(id))
             raise VectorIndexError(f"Failed to index document: {e}")
 
+    async def index_documents(
+        self,
+        items: list[tuple[UUID, str, dict | None]],
+    ) -> None:
+        """
+        Store multiple documents with one batched embedding call
+
+        Args:
+            items: (document UUID, text, metadata) tuples
+        """
+        if not items:
+            return
+
+        try:
+            embeddings = await self.embedding_service.embed_passages(
+                [text for _id, text, _metadata in items]
+            )
+        except Exception as e:
+            logger.error("index_error", error=str(e), documents=len(items))
+            raise VectorIndexError(f"Failed to index documents: {e}")
+
+        for (doc_id, text, metadata), embedding in zip(items, embeddings):
+            self._storage[doc_id] = (text, metadata)
+            self._embeddings[doc_id] = embedding
+        self._matrix = None
+        logger.debug("documents_indexed", index=self.index_name, documents=len(items))
+
     async def search(
         self,
         query: str,
         top_k: int = 10,
         metadata_filter: dict | None = None,
+        include_metadata: bool = True,
     ) -> list[VectorSearchResult]:
         """
         Semantic search using E5 embeddings (mock implementation).
@@ -91,6 +127,7 @@ class MockVectorStore:
             query: Query text
             top_k: Number of results
             metadata_filter: Optional filters (not implemented in mock)
+            include_metadata: False to return results with metadata=None
 
         Returns:
             List of search results sorted by semantic similarity
@@ -102,32 +139,38 @@ class MockVectorStore:
         try:
             # Embed query using EmbeddingService with "query:" prefix
             query_embedding = await self.embedding_service.embed_query(query)
-            results = []
-
-            # Calculate similarity for each stored document
-            for doc_id, (text, metadata) in self._storage.items():
-                # Embed document using EmbeddingService with "passage:" prefix
-                doc_embedding = await self.embedding_service.embed_passage(text)
-
-                # Cosine similarity: dot product of L2-normalized vectors
-                score = sum(a * b for a, b in zip(query_embedding, doc_embedding))
-
-                if score > 0:
-                    results.append(
-                        VectorSearchResult(id=doc_id, score=float(score), metadata=metadata)
-                    )
-
-            # Sort by score descending
-            results.sort(key=lambda r: r.score, reverse=True)
-
-            # Return top K
-            top_results = results[:top_k]
+            if not self._embeddings:
+                return []
+            matrix = self._get_matrix()
+
+            # Cosine similarity: dot product of L2-normalized vectors (one matrix-vector product)
+            scores = matrix @ np.asarray(query_embedding, dtype=np.float32)
+            candidates = np.flatnonzero(scores > 0)
+            results_found = len(candidates)
+
+            # Top K by score descending (partial selection instead of a full sort)
+            if top_k <= 0:
+                candidates = candidates[:0]
+            elif top_k < len(candidates):
+                candidates = candidates[np.argpartition(scores[candidates], -top_k)[-top_k:]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            top_results = [
+                VectorSearchResult(
+                    id=self._matrix_ids[idx],
+                    score=float(scores[idx]),
+                    metadata=(
+                        self._storage[self._matrix_ids[idx]][1] if include_metadata else None
+                    ),
+                )
+                for idx in candidates
+            ]
 
             logger.debug(
                 "search_completed",
                 index=self.index_name,
                 query_length=len(query),
-                results_found=len(results),
+                results_found=results_found,
                 top_k=top_k,
             )
 
@@ -146,6 +189,8 @@ class MockVectorStore:
         """
         if id in self._storage:
             del self._storage[id]
+            del self._embeddings[id]
+            self._matrix = None
             logger.debug("document_deleted", index=self.index_name, doc_id=str(id))
 
     async def update_document(
@@ -155,15 +200,35 @@ class MockVectorStore:
         metadata: dict | None = None,
     ) -> None:
         """
-        Update existing document (delete + re-index)
+        Update existing document (overwrite in place)
 
         Args:
             id: Document UUID
             text: New text content
             metadata: New metadata
         """
-        await self.delete_document(id)
-        await self.index_document(id, text, metadata)
+        stored = self._storage.get(id)
+        if stored is not None and stored[0] == text:
+            # 본문이 같으면 임베딩은 그대로 두고 메타데이터만 교체
+            self._storage[id] = (text, metadata)
+            logger.debug("document_metadata_updated", index=self.index_name, doc_id=str(id))
+            return
+
+        try:
+            embedding = await self.embedding_service.embed_passage(text)
+        except Exception as e:
+            logger.error("index_error", error=str(e), doc_id=str(id))
+            raise VectorIndexError(f"Failed to index document: {e}")
+
+        self._storage[id] = (text, metadata)
+        self._embeddings[id] = embedding
+        self._matrix = None
+        logger.debug(
+            "document_updated",
+            index=self.index_name,
+            doc_id=str(id),
+            text_length=len(text),
+        )
 
     async def clear_index(self) -> None:
         """
@@ -171,8 +236,19 @@ class MockVectorStore:
         """
         count = len(self._storage)
         self._storage.clear()
+        self._embeddings.clear()
+        self._matrix = None
         logger.info("index_cleared", index=self.index_name, documents_removed=count)
 
+    def _get_matrix(self) -> np.ndarray:
+        """Stack stored embeddings into a C-contiguous (N, D) float32 matrix (cached)."""
+        if self._matrix is None:
+            self._matrix_ids = list(self._embeddings)
+            self._matrix = np.ascontiguousarray(
+                np.array(list(self._embeddings.values()), dtype=np.float32)
+            )
+        return self._matrix
+
     async def similarity(self, text1: str, text2: str) -> float:
         """
         Calculate cosine similarity between query (text1) and passage (text2).
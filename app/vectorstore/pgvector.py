@@ -13,14 +13,17 @@ Reference: Unit Specification v1.1
 from __future__ import annotations
 
 import asyncio
+import math
 import re
 from datetime import datetime
+from itertools import combinations
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import text as sa_text, bindparam, String, Integer
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.core.config import settings
@@ -31,6 +34,12 @@ from app.llm.embedder import get_embedding_service
 
 logger = get_logger(__name__)
 
+# Metadata columns search() can filter on (statement cache key order)
+_FILTER_KEYS = ("branch_code", "business_type", "error_code")
+
+# halfvec (FP16 storage) and halfvec HNSW opclasses need pgvector >= 0.7
+_HALFVEC_MIN_VERSION = (0, 7)
+
 
 class PGVectorStore(VectorStoreProtocol):
     """PostgreSQL + pgvector-backed VectorStore.
@@ -52,6 +61,13 @@ class PGVectorStore(VectorStoreProtocol):
         self.embedding_service = get_embedding_service()
         self._init_lock = asyncio.Lock()
         self._initialized = False
+        # Decided during initialization (existing column type, setting, pgvector version)
+        self._use_halfvec = False
+        # hnsw.iterative_scan requires pgvector >= 0.8; probed on first search
+        self._iterative_scan_supported: bool | None = None
+        # Built statements, reused across calls (search keyed by filter columns)
+        self._search_stmts: dict[tuple[tuple[str, ...], bool], Any] = {}
+        self._upsert_stmt: Any = None
 
     async def index_document(
         self,
@@ -63,91 +79,60 @@ class PGVectorStore(VectorStoreProtocol):
 
         # Use EmbeddingService with "passage:" prefix (E5 requirement)
         embedding = await self.embedding_service.embed_passage(text)
-        metadata = metadata or {}
-        metadata_json = self._normalize_metadata(metadata)
+        params = self._upsert_params(id, embedding, metadata)
 
-        params: dict[str, Any] = {
-            "id": id,
-            "embedding": embedding,
-            "metadata": metadata_json,
-            "branch_code": metadata.get("branch_code"),
-            "business_type": metadata.get("business_type"),
-            "error_code": metadata.get("error_code"),
-            "created_at": metadata.get("created_at"),
-        }
+        async with self.engine.begin() as conn:
+            await conn.execute(self._upsert_statement(), params)
+            logger.info("pgvector_indexed", index=self.index_name, doc_id=str(id))
 
-        upsert_sql = f"""
-            INSERT INTO {self.table_name}
-                (id, embedding, metadata, branch_code, business_type, error_code, created_at)
-            VALUES
-                (:id, :embedding, :metadata, :branch_code, :business_type, :error_code, :created_at)
-            ON CONFLICT (id) DO UPDATE SET
-                embedding = EXCLUDED.embedding,
-                metadata = EXCLUDED.metadata,
-                branch_code = EXCLUDED.branch_code,
-                business_type = EXCLUDED.business_type,
-                error_code = EXCLUDED.error_code,
-                created_at = COALESCE(EXCLUDED.created_at, {self.table_name}.created_at)
-        """
+    async def index_documents(
+        self,
+        items: list[tuple[UUID, str, dict | None]],
+    ) -> None:
+        """Index many documents: one batched embedding call, one transaction (executemany)."""
 
-        stmt = sa_text(upsert_sql).bindparams(
-            bindparam("id", type_=PGUUID()),
-            bindparam("embedding", type_=Vector(self.dimension)),
-            bindparam("metadata", type_=JSONB),
-            bindparam("branch_code", type_=String()),
-            bindparam("business_type", type_=String()),
-            bindparam("error_code", type_=String()),
+        if not items:
+            return
+
+        await self._ensure_initialized()
+
+        embeddings = await self.embedding_service.embed_passages(
+            [text for _id, text, _metadata in items]
         )
+        params_list = [
+            self._upsert_params(doc_id, embedding, metadata)
+            for (doc_id, _text, metadata), embedding in zip(items, embeddings)
+        ]
 
         async with self.engine.begin() as conn:
-            await conn.execute(stmt, params)
-            logger.info("pgvector_indexed", index=self.index_name, doc_id=str(id))
+            await conn.execute(self._upsert_statement(), params_list)
+            logger.info("pgvector_indexed_batch", index=self.index_name, documents=len(items))
 
     async def search(
         self,
         query: str,
         top_k: int = 10,
         metadata_filter: dict | None = None,
+        include_metadata: bool = True,
     ) -> list[VectorSearchResult]:
         await self._ensure_initialized()
 
         # Use EmbeddingService with "query:" prefix (E5 requirement)
         query_embedding = await self.embedding_service.embed_query(query)
-        filters: list[str] = []
         params: dict[str, Any] = {"embedding": query_embedding, "limit": top_k}
 
         metadata_filter = metadata_filter or {}
-        for key in ("branch_code", "business_type", "error_code"):
+        filter_keys: list[str] = []
+        for key in _FILTER_KEYS:
             value = metadata_filter.get(key)
             if value is not None:
-                filters.append(f"{key} = :{key}")
+                filter_keys.append(key)
                 params[key] = value
 
-        where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
-
-        # similarity: convert L2 distance to [0,1) score (1/(1+distance))
-        search_sql = f"""
-            SELECT
-                id,
-                metadata,
-                1.0 / (1.0 + (embedding <-> :embedding)) AS score
-            FROM {self.table_name}
-            {where_clause}
-            ORDER BY embedding <-> :embedding
-            LIMIT :limit
-        """
+        search_stmt = self._search_statement(tuple(filter_keys), include_metadata)
 
-        bind_list = [
-            bindparam("embedding", type_=Vector(self.dimension)),
-            bindparam("limit", type_=Integer()),
-        ]
-        for key in ("branch_code", "business_type", "error_code"):
-            if key in params:
-                bind_list.append(bindparam(key, type_=String(), required=False))
-
-        search_stmt = sa_text(search_sql).bindparams(*bind_list)
-
-        async with self.engine.connect() as conn:
+        async with self.engine.begin() as conn:
+            await self._apply_search_settings(conn, top_k, filtered=bool(filter_keys))
             result = await conn.execute(search_stmt, params)
             rows = result.fetchall()
 
@@ -209,6 +194,47 @@ class PGVectorStore(VectorStoreProtocol):
 
     # Internal helpers -------------------------------------------------
 
+    async def _apply_search_settings(self, conn: Any, top_k: int, *, filtered: bool) -> None:
+        """Apply per-query ANN index settings (transaction-local, like SET LOCAL).
+
+        Metadata filters are applied after the HNSW scan, so filtered searches
+        enable iterative scan to keep walking the graph until top_k rows pass.
+        """
+
+        if settings.pgvector_index_type == "ivfflat":
+            await conn.execute(
+                sa_text("SELECT set_config('ivfflat.probes', :value, true)"),
+                {"value": str(settings.pgvector_ivfflat_probes)},
+            )
+            return
+
+        ef_search = max(top_k * 4, settings.pgvector_ef_search)
+        await conn.execute(
+            sa_text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {"value": str(ef_search)},
+        )
+
+        if not filtered or self._iterative_scan_supported is False:
+            return
+        try:
+            # Savepoint so an unsupported GUC does not abort the search transaction
+            async with conn.begin_nested():
+                await conn.execute(
+                    sa_text("SELECT set_config('hnsw.iterative_scan', 'strict_order', true)")
+                )
+                await conn.execute(
+                    sa_text("SELECT set_config('hnsw.max_scan_tuples', :value, true)"),
+                    {"value": str(settings.pgvector_max_scan_tuples)},
+                )
+            self._iterative_scan_supported = True
+        except DBAPIError as exc:
+            self._iterative_scan_supported = False
+            logger.info(
+                "pgvector_iterative_scan_unsupported",
+                table=self.table_name,
+                error=str(exc.orig),
+            )
+
     async def _ensure_initialized(self) -> None:
         if self._initialized:
             return
@@ -217,13 +243,50 @@ class PGVectorStore(VectorStoreProtocol):
                 return
 
             await self._create_extension_and_table()
+            # Build every search statement shape up front (8 filter subsets x with/without metadata)
+            for size in range(len(_FILTER_KEYS) + 1):
+                for filter_keys in combinations(_FILTER_KEYS, size):
+                    self._search_statement(filter_keys, True)
+                    self._search_statement(filter_keys, False)
             self._initialized = True
 
     async def _create_extension_and_table(self) -> None:
+        async with self.engine.begin() as conn:
+            await self._lock_initialization(conn)
+            await conn.execute(sa_text("CREATE EXTENSION IF NOT EXISTS vector"))
+            version_res = await conn.execute(
+                sa_text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            )
+            halfvec_supported = (
+                _parse_extversion(version_res.scalar_one()) >= _HALFVEC_MIN_VERSION
+            )
+            existing_type = await self._existing_embedding_type(conn)
+
+        # Existing tables keep their column type; converting FP32 -> FP16 is lossy and
+        # must be done deliberately (not at startup). New tables use halfvec only when
+        # PGVECTOR_USE_HALFVEC is enabled and pgvector supports it.
+        if existing_type is not None:
+            self._use_halfvec = existing_type == "halfvec"
+            if settings.pgvector_use_halfvec and not self._use_halfvec:
+                logger.warning(
+                    "pgvector_halfvec_not_applied_existing_table",
+                    table=self.table_name,
+                    column_type=existing_type,
+                )
+        else:
+            self._use_halfvec = settings.pgvector_use_halfvec and halfvec_supported
+            if settings.pgvector_use_halfvec and not halfvec_supported:
+                logger.warning("pgvector_halfvec_unsupported", table=self.table_name)
+
+        column_type = "HALFVEC" if self._use_halfvec else "VECTOR"
+        opclass = "halfvec_cosine_ops" if self._use_halfvec else "vector_cosine_ops"
+        index_type = settings.pgvector_index_type
+        index_suffix = f"embedding_{'halfvec' if self._use_halfvec else 'cosine'}_{index_type}"
+
         create_table_sql = f"""
             CREATE TABLE IF NOT EXISTS {self.table_name} (
                 id UUID PRIMARY KEY,
-                embedding VECTOR({self.dimension}) NOT NULL,
+                embedding {column_type}({self.dimension}) NOT NULL,
                 metadata JSONB DEFAULT '{{}}'::jsonb,
                 branch_code TEXT NULL,
                 business_type TEXT NULL,
@@ -245,8 +308,28 @@ class PGVectorStore(VectorStoreProtocol):
         business_idx = f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_business ON {self.table_name} (business_type)"
         error_idx = f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_error ON {self.table_name} (error_code)"
 
+        # ANN index for search(): ORDER BY embedding <=> :embedding (cosine) needs a *_cosine_ops class
+        stale_embedding_idxs = [
+            f"DROP INDEX IF EXISTS idx_{self.table_name}_{suffix}"
+            for suffix in (
+                "embedding_hnsw",
+                "embedding_cosine_hnsw",
+                "embedding_halfvec_hnsw",
+                "embedding_cosine_ivfflat",
+                "embedding_halfvec_ivfflat",
+            )
+            if suffix != index_suffix
+        ]
+        index_name = f"idx_{self.table_name}_{index_suffix}"
+        hnsw_idx = (
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {self.table_name} USING hnsw (embedding {opclass}) "
+            f"WITH (m = {int(settings.pgvector_hnsw_m)}, "
+            f"ef_construction = {int(settings.pgvector_hnsw_ef_construction)})"
+        )
+
         async with self.engine.begin() as conn:
-            await conn.execute(sa_text("CREATE EXTENSION IF NOT EXISTS vector"))
+            await self._lock_initialization(conn)
             await self._recreate_table_if_incompatible(conn)
             await conn.execute(sa_text(create_table_sql))
             for stmt in alter_columns:
@@ -254,7 +337,86 @@ class PGVectorStore(VectorStoreProtocol):
             await conn.execute(sa_text(branch_idx))
             await conn.execute(sa_text(business_idx))
             await conn.execute(sa_text(error_idx))
-            logger.info("pgvector_table_ready", table=self.table_name, dimension=self.dimension)
+            # Build memory/parallelism only apply to this transaction (SET LOCAL)
+            await conn.execute(
+                sa_text("SELECT set_config('maintenance_work_mem', :value, true)"),
+                {"value": settings.pgvector_hnsw_maintenance_work_mem},
+            )
+            await conn.execute(
+                sa_text("SELECT set_config('max_parallel_maintenance_workers', :value, true)"),
+                {"value": str(settings.pgvector_hnsw_parallel_workers)},
+            )
+            for stmt in stale_embedding_idxs:
+                await conn.execute(sa_text(stmt))
+            if index_type == "ivfflat":
+                embedding_idx = await self._ivfflat_index_sql(conn, index_name, opclass)
+            else:
+                embedding_idx = hnsw_idx
+            if embedding_idx is not None:
+                await conn.execute(sa_text(embedding_idx))
+            logger.info(
+                "pgvector_table_ready",
+                table=self.table_name,
+                dimension=self.dimension,
+                embedding_type=column_type.lower(),
+                index_type=index_type,
+            )
+
+    async def _lock_initialization(self, conn: Any) -> None:
+        """Serialize schema setup for this table across workers (released at commit).
+
+        Later workers wait for the first one and then find every object already
+        in place, so IF NOT EXISTS DDL and catalog probes cannot race.
+        """
+
+        await conn.execute(
+            sa_text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"pgvector_init:{self.table_name}"},
+        )
+
+    async def _ivfflat_index_sql(self, conn: Any, index_name: str, opclass: str) -> str | None:
+        """IVFFlat index DDL with lists sized from the current row count.
+
+        IVFFlat clusters are trained from existing rows, so the index is only
+        built once the table has data (bulk load first, then initialize).
+        """
+
+        exists_res = await conn.execute(
+            sa_text("SELECT to_regclass(:index_name) IS NOT NULL"), {"index_name": index_name}
+        )
+        if exists_res.scalar_one():
+            return None
+
+        count_res = await conn.execute(sa_text(f"SELECT COUNT(*) FROM {self.table_name}"))
+        row_count = count_res.scalar_one()
+        if row_count == 0:
+            logger.info("pgvector_ivfflat_index_deferred", table=self.table_name)
+            return None
+
+        lists = max(100, math.isqrt(row_count))
+        return (
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {self.table_name} USING ivfflat (embedding {opclass}) "
+            f"WITH (lists = {lists})"
+        )
+
+    async def _existing_embedding_type(self, conn: Any) -> str | None:
+        """Type name of an existing embedding column ("vector"/"halfvec"), None if absent."""
+
+        type_res = await conn.execute(
+            sa_text(
+                """
+                SELECT udt_name
+                FROM information_schema.columns
+                WHERE table_name = :table AND column_name = 'embedding'
+                """
+            ),
+            {"table": self.table_name},
+        )
+        return type_res.scalar_one_or_none()
+
+    def _embedding_bind_type(self) -> Any:
+        return HALFVEC(self.dimension) if self._use_halfvec else Vector(self.dimension)
 
     async def _recreate_table_if_incompatible(self, conn: Any) -> None:
         """Drop and recreate table if existing schema is incompatible.
@@ -301,14 +463,89 @@ class PGVectorStore(VectorStoreProtocol):
             )
 
     def _resolve_table_name(self, index_name: str) -> str:
-        table_name = settings.pgvector_table_consultation
+        # Names are validated as plain SQL identifiers when settings load
         if index_name == "manuals":
-            table_name = settings.pgvector_table_manual
+            return settings.pgvector_table_manual
+        return settings.pgvector_table_consultation
+
+    def _upsert_params(
+        self,
+        id: UUID,
+        embedding: list[float],
+        metadata: dict | None,
+    ) -> dict[str, Any]:
+        metadata = metadata or {}
+        return {
+            "id": id,
+            "embedding": embedding,
+            "metadata": self._normalize_metadata(metadata),
+            "branch_code": metadata.get("branch_code"),
+            "business_type": metadata.get("business_type"),
+            "error_code": metadata.get("error_code"),
+            "created_at": metadata.get("created_at"),
+        }
+
+    def _upsert_statement(self) -> Any:
+        if self._upsert_stmt is not None:
+            return self._upsert_stmt
 
-        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table_name):
-            raise ValueError(f"Unsafe table name: {table_name}")
+        upsert_sql = f"""
+            INSERT INTO {self.table_name}
+                (id, embedding, metadata, branch_code, business_type, error_code, created_at)
+            VALUES
+                (:id, :embedding, :metadata, :branch_code, :business_type, :error_code, :created_at)
+            ON CONFLICT (id) DO UPDATE SET
+                embedding = EXCLUDED.embedding,
+                metadata = EXCLUDED.metadata,
+                branch_code = EXCLUDED.branch_code,
+                business_type = EXCLUDED.business_type,
+                error_code = EXCLUDED.error_code,
+                created_at = COALESCE(EXCLUDED.created_at, {self.table_name}.created_at)
+        """
 
-        return table_name
+        self._upsert_stmt = sa_text(upsert_sql).bindparams(
+            bindparam("id", type_=PGUUID()),
+            bindparam("embedding", type_=self._embedding_bind_type()),
+            bindparam("metadata", type_=JSONB),
+            bindparam("branch_code", type_=String()),
+            bindparam("business_type", type_=String()),
+            bindparam("error_code", type_=String()),
+        )
+        return self._upsert_stmt
+
+    def _search_statement(self, filter_keys: tuple[str, ...], include_metadata: bool) -> Any:
+        """Search statement for a filter-column shape (built once, then reused)."""
+
+        stmt = self._search_stmts.get((filter_keys, include_metadata))
+        if stmt is not None:
+            return stmt
+
+        where_clause = (
+            f"WHERE {' AND '.join(f'{key} = :{key}' for key in filter_keys)}"
+            if filter_keys
+            else ""
+        )
+
+        # similarity: cosine distance -> cosine similarity (1 - distance), same scale as similarity()
+        # E5 embeddings are L2-normalized by EmbeddingService, so cosine order == L2 order
+        search_sql = f"""
+            SELECT
+                id,
+                {"metadata" if include_metadata else "NULL::jsonb AS metadata"},
+                1 - (embedding <=> :embedding) AS score
+            FROM {self.table_name}
+            {where_clause}
+            ORDER BY embedding <=> :embedding
+            LIMIT :limit
+        """
+
+        stmt = sa_text(search_sql).bindparams(
+            bindparam("embedding", type_=self._embedding_bind_type()),
+            bindparam("limit", type_=Integer()),
+            *(bindparam(key, type_=String(), required=False) for key in filter_keys),
+        )
+        self._search_stmts[(filter_keys, include_metadata)] = stmt
+        return stmt
 
     def _normalize_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
         """Convert metadata to JSON-serializable values (datetimes -> isoformat)."""
@@ -320,3 +557,12 @@ class PGVectorStore(VectorStoreProtocol):
             else:
                 normalized[key] = value
         return normalized
+
+
+def _parse_extversion(version: str) -> tuple[int, int]:
+    """Parse pgvector extversion (e.g. "0.8.0") into (major, minor)."""
+
+    match = re.match(r"(\d+)\.(\d+)", version)
+    if match is None:
+        return (0, 0)
+    return (int(match.group(1)), int(match.group(2)))
@@ -51,11 +51,27 @@ class VectorStoreProtocol(Protocol):
         """
         ...
 
+    async def index_documents(
+        self,
+        items: list[tuple[UUID, str, dict | None]],
+    ) -> None:
+        """
+        Index multiple documents (batched embedding and storage)
+
+        Args:
+            items: (document UUID, text, metadata) tuples
+
+        Raises:
+            VectorIndexError: If indexing fails
+        """
+        ...
+
     async def search(
         self,
         query: str,
         top_k: int = 10,
         metadata_filter: dict | None = None,
+        include_metadata: bool = True,
     ) -> list[VectorSearchResult]:
         """
         Search for similar documents
@@ -64,6 +80,8 @@ class VectorStoreProtocol(Protocol):
             query: Query text to embed and search
             top_k: Number of results to return
             metadata_filter: Optional metadata filters
+            include_metadata: False when only ids/scores are needed
+                (results carry metadata=None)
 
         Returns:
             List of search results ordered by similarity (highest first)
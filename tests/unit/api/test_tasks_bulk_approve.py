@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.main import app
+from app.core.dependencies import get_current_user
+from app.models.task import ManualReviewTask, TaskStatus
+from app.models.user import UserRole
+from app.repositories.common_code_rdb import CommonCodeItemRepository
+from app.repositories.manual_rdb import (
+    ManualEntryRDBRepository,
+    ManualReviewTaskRepository,
+)
+from app.routers import tasks
+from app.services.manual_service import ManualService
+from app.services.task_service import TaskService
+
+
+def _reviewer(department_id):
+    user = MagicMock()
+    user.role = UserRole.REVIEWER
+    user.employee_id = "reviewer-001"
+    link = MagicMock()
+    link.department_id = department_id
+    link.is_primary = True
+    user.department_links = [link]
+    return user
+
+
+def _task(reviewer_department_id):
+    now = datetime.now(timezone.utc)
+    return ManualReviewTask(
+        id=uuid4(),
+        created_at=now,
+        updated_at=now,
+        old_entry_id=None,
+        new_entry_id=uuid4(),
+        similarity=0.9,
+        status=TaskStatus.TODO,
+        reviewer_id=None,
+        reviewer_department_id=reviewer_department_id,
+        review_notes=None,
+    )
+
+
+@pytest.fixture
+def bulk_client(monkeypatch):
+    """Override auth and TaskService dependencies; returns (client, set_user, task_repo)."""
+
+    session = AsyncMock(spec=AsyncSession)
+    session.add_all = MagicMock()
+    task_repo = AsyncMock(spec=ManualReviewTaskRepository)
+    manual_service = AsyncMock(spec=ManualService)
+    service = TaskService(
+        session=session,
+        manual_service=manual_service,
+        task_repo=task_repo,
+        manual_repo=AsyncMock(spec=ManualEntryRDBRepository),
+        common_code_item_repo=AsyncMock(spec=CommonCodeItemRepository),
+    )
+    state = {}
+
+    app.dependency_overrides[tasks.get_task_service] = lambda: service
+    app.dependency_overrides[get_current_user] = lambda: state["user"]
+
+    class NoOpEmbeddingService:
+        async def warmup(self) -> None:
+            return None
+
+    monkeypatch.setattr(
+        "app.api.main.get_embedding_service",
+        lambda: NoOpEmbeddingService(),
+    )
+    with TestClient(app) as client:
+        yield client, state, task_repo, manual_service
+    app.dependency_overrides.pop(tasks.get_task_service, None)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_bulk_approve_unknown_task_returns_404(bulk_client) -> None:
+    client, state, task_repo, manual_service = bulk_client
+    department_id = uuid4()
+    state["user"] = _reviewer(department_id)
+    known = _task(department_id)
+    task_repo.find_by_ids.return_value = [known]
+
+    response = client.post(
+        "/api/v1/manual-review/tasks/bulk-approve",
+        json={
+            "task_ids": [str(known.id), str(uuid4())],
+            "employee_id": "reviewer-001",
+            "review_notes": "일괄 승인",
+        },
+    )
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "RecordNotFoundError"
+    assert known.status == TaskStatus.TODO
+    manual_service.approve_manual.assert_not_awaited()
+
+
+def test_bulk_approve_task_outside_department_returns_403(bulk_client) -> None:
+    client, state, task_repo, manual_service = bulk_client
+    department_id = uuid4()
+    state["user"] = _reviewer(department_id)
+    own = _task(department_id)
+    other = _task(uuid4())
+    task_repo.find_by_ids.return_value = [own, other]
+
+    response = client.post(
+        "/api/v1/manual-review/tasks/bulk-approve",
+        json={
+            "task_ids": [str(own.id), str(other.id)],
+            "employee_id": "reviewer-001",
+            "review_notes": "일괄 승인",
+        },
+    )
+
+    assert response.status_code == 403
+    assert own.status == TaskStatus.TODO
+    manual_service.approve_manual.assert_not_awaited()
@@ -0,0 +1,66 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.llm.embedder import EmbeddingService
+
+
+class _CountingModel:
+    def __init__(self) -> None:
+        self.calls: list[object] = []
+
+    def encode(self, texts, batch_size=None, normalize_embeddings=False):
+        self.calls.append(texts)
+        if isinstance(texts, str):
+            return np.full(3, float(len(texts)), dtype=np.float32)
+        return np.array([[float(len(t))] * 3 for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(EmbeddingService, "_instance", None)
+    svc = EmbeddingService()
+    svc.model = _CountingModel()
+    svc._semaphore = asyncio.Semaphore(1)
+    svc._initialized = True
+    svc._embedding_cache_size = 2
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_repeated_embeddings_skip_the_model(service):
+    first = await service.embed_query("로그인 오류")
+    first.append(0.0)  # 호출자가 결과를 변경해도 캐시는 영향을 받지 않음
+    second = await service.embed_query("로그인 오류")
+
+    assert len(second) == 3
+    assert service.model.calls == ["query: 로그인 오류"]
+
+    # 같은 텍스트라도 query/passage 접두어가 다르면 별도 항목
+    await service.embed_passage("로그인 오류")
+    assert len(service.model.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_passages_encodes_only_cache_misses_and_evicts_lru(service):
+    await service.embed_passage("a")
+    embeddings = await service.embed_passages(["a", "bb"])
+
+    assert [e[0] for e in embeddings] == [len("passage: a"), len("passage: bb")]
+    assert service.model.calls == ["passage: a", ["passage: bb"]]
+
+    # 최대 2개: 가장 오래 사용하지 않은 "a"가 밀려남
+    await service.embed_passage("ccc")
+    await service.embed_passage("a")
+    assert service.model.calls[-1] == "passage: a"
+
+
+@pytest.mark.asyncio
+async def test_cache_stores_float32_arrays(service):
+    embedding = await service.embed_query("로그인 오류")
+
+    (cached,) = service._embedding_cache.values()
+    assert cached.dtype == np.float32
+    assert isinstance(embedding, list)
+    assert cached.tolist() == embedding
@@ -0,0 +1,89 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.common_code_cache as common_code_cache
+from app.repositories.common_code_rdb import CommonCodeItemRepository
+from app.services.manual_service import ManualService
+
+
+class DummyLLM:
+    async def complete_json(self, *args, **kwargs):
+        return {}
+
+    async def complete(self, *args, **kwargs):
+        return {"content": ""}
+
+
+def _build_service(common_code_repo) -> ManualService:
+    return ManualService(
+        session=AsyncMock(spec=AsyncSession),
+        llm_client=DummyLLM(),
+        vectorstore=None,
+        manual_repo=MagicMock(),
+        review_repo=MagicMock(),
+        version_repo=MagicMock(),
+        consultation_repo=MagicMock(),
+        common_code_item_repo=common_code_repo,
+        comparison_service=MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_business_type_map_cached_across_service_instances(monkeypatch):
+    monkeypatch.setattr(common_code_cache, "_common_code_maps", {})
+
+    common_code_repo = MagicMock(spec=CommonCodeItemRepository)
+    common_code_repo.get_by_group_code = AsyncMock(
+        return_value=[SimpleNamespace(code_key="IB", code_value="인터넷뱅킹")]
+    )
+
+    first = await _build_service(common_code_repo)._get_business_type_map()
+    second = await _build_service(common_code_repo)._get_business_type_map()
+
+    assert first == second == {"IB": "인터넷뱅킹"}
+    common_code_repo.get_by_group_code.assert_awaited_once_with(
+        "BUSINESS_TYPE", is_active_only=True
+    )
+
+    # TTL 만료 후에는 다시 조회
+    monkeypatch.setattr(common_code_cache, "_COMMON_CODE_MAP_TTL_SECONDS", 0.0)
+    await _build_service(common_code_repo)._get_business_type_map()
+    assert common_code_repo.get_by_group_code.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_business_type_lookup_fetches_one_row_when_cache_cold(monkeypatch):
+    monkeypatch.setattr(common_code_cache, "_common_code_maps", {})
+
+    common_code_repo = MagicMock(spec=CommonCodeItemRepository)
+    common_code_repo.get_by_key = AsyncMock(
+        return_value=SimpleNamespace(code_key="IB", code_value="인터넷뱅킹")
+    )
+    common_code_repo.get_by_group_code = AsyncMock(return_value=[])
+
+    name = await _build_service(common_code_repo)._lookup_business_type_name("IB")
+
+    assert name == "인터넷뱅킹"
+    common_code_repo.get_by_key.assert_awaited_once_with(
+        "BUSINESS_TYPE", "IB", is_active_only=True
+    )
+    common_code_repo.get_by_group_code.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_business_type_map_refetched_after_invalidation(monkeypatch):
+    monkeypatch.setattr(common_code_cache, "_common_code_maps", {})
+
+    common_code_repo = MagicMock(spec=CommonCodeItemRepository)
+    common_code_repo.get_by_group_code = AsyncMock(
+        return_value=[SimpleNamespace(code_key="IB", code_value="인터넷뱅킹")]
+    )
+
+    await _build_service(common_code_repo)._get_business_type_map()
+    common_code_cache.invalidate_common_code_map()
+    await _build_service(common_code_repo)._get_business_type_map()
+
+    assert common_code_repo.get_by_group_code.await_count == 2
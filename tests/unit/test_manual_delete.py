@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.models.manual import ManualEntry, ManualStatus
+from app.repositories.manual_rdb import (
+    ManualEntryRDBRepository,
+    ManualReviewTaskRepository,
+)
+from app.services.manual_service import ManualService
+
+
+class DummyLLM:
+    async def complete_json(self, *args, **kwargs):
+        return {}
+
+    async def complete(self, *args, **kwargs):
+        return {"content": ""}
+
+
+def _draft(status: ManualStatus = ManualStatus.DRAFT) -> ManualEntry:
+    return ManualEntry(
+        id=uuid4(),
+        keywords=["test"],
+        topic="Draft topic",
+        background="Background",
+        guideline="Guide",
+        business_type="결제",
+        error_code="E001",
+        source_consultation_id=uuid4(),
+        status=status,
+    )
+
+
+def _build_service(manual: ManualEntry, events: list[str]):
+    manual_repo = MagicMock(spec=ManualEntryRDBRepository)
+    manual_repo.get_by_id_or_raise = AsyncMock(return_value=manual)
+    manual_repo.delete = AsyncMock(side_effect=lambda m: events.append("manual_delete"))
+
+    async def delete_tasks(manual_id):
+        events.append("tasks_start")
+        await asyncio.sleep(0)
+        events.append("tasks_done")
+        return 2
+
+    review_repo = MagicMock(spec=ManualReviewTaskRepository)
+    review_repo.delete_by_manual_id = AsyncMock(side_effect=delete_tasks)
+
+    async def delete_vector(manual_id):
+        events.append("vector_start")
+        await asyncio.sleep(0)
+        events.append("vector_done")
+
+    vectorstore = MagicMock()
+    vectorstore.delete_document = AsyncMock(side_effect=delete_vector)
+
+    session = AsyncMock(spec=AsyncSession)
+    service = ManualService(
+        session=session,
+        llm_client=DummyLLM(),
+        vectorstore=vectorstore,
+        manual_repo=manual_repo,
+        review_repo=review_repo,
+        version_repo=MagicMock(),
+        consultation_repo=MagicMock(),
+        common_code_item_repo=MagicMock(),
+        comparison_service=MagicMock(),
+    )
+    return service, review_repo, vectorstore, session
+
+
+@pytest.mark.asyncio
+async def test_delete_manual_cleans_vector_and_tasks_concurrently():
+    manual = _draft()
+    events: list[str] = []
+    service, review_repo, vectorstore, session = _build_service(manual, events)
+
+    await service.delete_manual(manual.id)
+
+    vectorstore.delete_document.assert_awaited_once_with(manual.id)
+    review_repo.delete_by_manual_id.assert_awaited_once_with(manual.id)
+    # 두 정리 작업이 모두 시작된 뒤에 끝나고, 메뉴얼 삭제는 그 이후
+    assert set(events[:2]) == {"vector_start", "tasks_start"}
+    assert events[-1] == "manual_delete"
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_manual_rejects_non_draft():
+    manual = _draft(ManualStatus.APPROVED)
+    events: list[str] = []
+    service, review_repo, vectorstore, _session = _build_service(manual, events)
+
+    with pytest.raises(ValidationError):
+        await service.delete_manual(manual.id)
+
+    vectorstore.delete_document.assert_not_awaited()
+    review_repo.delete_by_manual_id.assert_not_awaited()
+    assert events == []
@@ -1,8 +1,10 @@
+import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
 
+from app.core.config import settings
 from app.core.exceptions import ValidationError
 from app.llm.protocol import LLMResponse
 from app.models.manual import ManualEntry, ManualStatus, ManualVersion
@@ -52,8 +54,11 @@ class FakeManualRepo:
     async def get_by_id(self, manual_id):
         return self._by_id.get(manual_id)
 
-    async def find_by_consultation_id(self, consultation_id):
-        return self.consultation_entries.get(consultation_id, [])
+    async def find_by_consultation_id(self, consultation_id, *, statuses=None):
+        entries = self.consultation_entries.get(consultation_id, [])
+        if statuses:
+            entries = [entry for entry in entries if entry.status in statuses]
+        return entries
 
 
 class FakeVersionRepo:
@@ -275,3 +280,126 @@ async def test_diff_draft_with_active_overrides_base_entry():
     assert len(diff.modified_entries) == 1
     assert diff.modified_entries[0].before.background == "Base background"
     assert diff.modified_entries[0].after.background == "Draft background updated"
+
+
+def test_calculate_diff_classifies_entries_by_logical_key():
+    consultation_id = uuid4()
+    common = dict(
+        guideline="Guide",
+        status=ManualStatus.APPROVED,
+        version_id=None,
+        consultation_id=consultation_id,
+    )
+    unchanged = _make_entry(
+        keywords=["k"], topic="T0", background="B0", business_type="biz0", error_code="E0", **common
+    )
+    before = _make_entry(
+        keywords=["a"], topic="T1", background="B1", business_type="biz", error_code="E1", **common
+    )
+    removed = _make_entry(
+        keywords=["b"], topic="T2", background="B2", business_type="biz2", error_code="E2", **common
+    )
+    after = _make_entry(
+        keywords=["a"], topic="T1", background="B1 updated", business_type="biz", error_code="E1", **common
+    )
+    added = _make_entry(
+        keywords=["c"], topic="T3", background="B3", business_type="biz3", error_code="E3", **common
+    )
+
+    service = ManualService(session=None, llm_client=DummyLLM())
+    diff = service._calculate_diff([unchanged, before, removed], [unchanged, after, added])
+
+    assert [e.logical_key for e in diff["added_entries"]] == ["biz3::E3"]
+    assert [e.logical_key for e in diff["removed_entries"]] == ["biz2::E2"]
+    assert [m.logical_key for m in diff["modified_entries"]] == ["biz::E1"]
+    assert diff["modified_entries"][0].changed_fields == ["background"]
+
+
+def test_calculate_diff_snapshots_each_reported_entry_once(monkeypatch):
+    consultation_id = uuid4()
+    common = dict(
+        guideline="Guide",
+        status=ManualStatus.APPROVED,
+        version_id=None,
+        consultation_id=consultation_id,
+    )
+    unchanged = _make_entry(
+        keywords=["k"], topic="T0", background="B0", business_type="biz0", error_code="E0", **common
+    )
+    before = _make_entry(
+        keywords=["a"], topic="T1", background="B1", business_type="biz", error_code="E1", **common
+    )
+    after = _make_entry(
+        keywords=["a"], topic="T1 updated", background="B1", business_type="biz", error_code="E1", **common
+    )
+    removed = _make_entry(
+        keywords=["b"], topic="T2", background="B2", business_type="biz2", error_code="E2", **common
+    )
+    added = _make_entry(
+        keywords=["c"], topic="T3", background="B3", business_type="biz3", error_code="E3", **common
+    )
+
+    service = ManualService(session=None, llm_client=DummyLLM())
+    snapshotted: list[ManualEntry] = []
+    original = service._to_snapshot
+
+    def counting_snapshot(entry, *, logical_key=None):
+        snapshotted.append(entry)
+        return original(entry, logical_key=logical_key)
+
+    monkeypatch.setattr(service, "_to_snapshot", counting_snapshot)
+    service._calculate_diff([unchanged, before, removed], [unchanged, after, added])
+
+    # 변경 없는 항목은 스냅샷을 만들지 않고, 보고되는 항목은 측별로 한 번씩만 만든다.
+    assert sorted(map(id, snapshotted)) == sorted(map(id, [before, after, removed, added]))
+
+
+@pytest.mark.asyncio
+async def test_summarize_diff_returns_none_when_llm_times_out(monkeypatch):
+    class SlowLLM(DummyLLM):
+        async def complete(self, *args, **kwargs):
+            await asyncio.sleep(1)
+            return LLMResponse(content="late summary")
+
+    monkeypatch.setattr(settings, "llm_summary_timeout_seconds", 0.01)
+    service = ManualService(session=None, llm_client=SlowLLM())
+    added = _make_entry(
+        keywords=["c"],
+        topic="T3",
+        background="B3",
+        guideline="Guide",
+        business_type="biz3",
+        error_code="E3",
+        status=ManualStatus.DRAFT,
+        version_id=None,
+        consultation_id=uuid4(),
+    )
+
+    summary = await service._summarize_diff(
+        service._calculate_diff([], [added]),
+        base_version="1",
+        compare_version="DRAFT",
+    )
+
+    assert summary is None
+
+
+@pytest.mark.asyncio
+async def test_summarize_diff_skips_llm_for_empty_diff():
+    class RecordingLLM(DummyLLM):
+        calls = 0
+
+        async def complete(self, *args, **kwargs):
+            RecordingLLM.calls += 1
+            return LLMResponse(content="summary")
+
+    service = ManualService(session=None, llm_client=RecordingLLM())
+
+    summary = await service._summarize_diff(
+        {"added_entries": [], "removed_entries": [], "modified_entries": []},
+        base_version="1",
+        compare_version="DRAFT",
+    )
+
+    assert summary is None
+    assert RecordingLLM.calls == 0
@@ -0,0 +1,147 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import AuthorizationError
+from app.models.manual import ManualEntry, ManualStatus
+from app.models.task import ManualReviewTask, TaskStatus
+from app.models.user import UserRole
+from app.repositories.manual_rdb import ManualReviewTaskRepository
+from app.services import manual_service as manual_service_module
+from app.services.manual_service import ManualService
+
+
+def _user(role: UserRole, department_ids: list[UUID]) -> MagicMock:
+    user = MagicMock()
+    user.role = role
+    links = []
+    for dept_id in department_ids:
+        link = MagicMock()
+        link.department_id = dept_id
+        links.append(link)
+    user.department_links = links
+    return user
+
+
+def _manual() -> ManualEntry:
+    return ManualEntry(
+        id=uuid4(),
+        keywords=["로그인"],
+        topic="로그인 오류",
+        background="배경",
+        guideline="가이드",
+        business_type="LOGIN",
+        error_code="E001",
+        source_consultation_id=uuid4(),
+        status=ManualStatus.DRAFT,
+    )
+
+
+def _task(manual: ManualEntry, department_id: UUID) -> ManualReviewTask:
+    now = datetime.now(timezone.utc)
+    task = ManualReviewTask(
+        id=uuid4(),
+        created_at=now,
+        updated_at=now,
+        old_entry_id=None,
+        new_entry_id=manual.id,
+        similarity=0.9,
+        status=TaskStatus.TODO,
+        reviewer_id=None,
+        reviewer_department_id=department_id,
+        review_notes=None,
+    )
+    task.new_entry = manual
+    task.old_entry = None
+    return task
+
+
+@pytest.fixture
+def review_repo(monkeypatch):
+    repo = MagicMock(spec=ManualReviewTaskRepository)
+    repo.exists_by_manual_id = AsyncMock(return_value=False)
+    repo.find_by_manual_id_with_entries = AsyncMock(return_value=[])
+    monkeypatch.setattr(
+        manual_service_module, "ManualReviewTaskRepository", lambda session: repo
+    )
+    return repo
+
+
+@pytest.fixture
+def service() -> ManualService:
+    service = ManualService(
+        session=AsyncMock(spec=AsyncSession),
+        llm_client=MagicMock(),
+        vectorstore=MagicMock(),
+        manual_repo=MagicMock(),
+        review_repo=MagicMock(),
+        version_repo=MagicMock(),
+        consultation_repo=MagicMock(),
+        common_code_item_repo=MagicMock(),
+        comparison_service=MagicMock(),
+    )
+    service._get_business_type_map = AsyncMock(return_value={"LOGIN": "로그인"})
+    return service
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("role", [UserRole.REVIEWER, UserRole.CONSULTANT])
+async def test_user_without_department_is_denied_when_tasks_exist(
+    service, review_repo, role
+):
+    review_repo.exists_by_manual_id.return_value = True
+
+    with pytest.raises(AuthorizationError):
+        await service.get_review_tasks_by_manual_id(uuid4(), _user(role, []))
+
+    review_repo.find_by_manual_id_with_entries.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_user_without_department_gets_empty_list_when_no_tasks(
+    service, review_repo
+):
+    result = await service.get_review_tasks_by_manual_id(
+        uuid4(), _user(UserRole.REVIEWER, [])
+    )
+
+    assert result == []
+    review_repo.find_by_manual_id_with_entries.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reviewer_gets_tasks_filtered_by_department_in_sql(service, review_repo):
+    department_id = uuid4()
+    manual = _manual()
+    task = _task(manual, department_id)
+    review_repo.find_by_manual_id_with_entries.return_value = [task]
+
+    result = await service.get_review_tasks_by_manual_id(
+        manual.id, _user(UserRole.REVIEWER, [department_id])
+    )
+
+    review_repo.find_by_manual_id_with_entries.assert_awaited_once_with(
+        manual.id, reviewer_department_ids=[department_id]
+    )
+    review_repo.exists_by_manual_id.assert_not_awaited()
+    assert [r.id for r in result] == [task.id]
+    assert result[0].business_type_name == "로그인"
+
+
+@pytest.mark.asyncio
+async def test_admin_sees_every_task_without_department_filter(service, review_repo):
+    manual = _manual()
+    tasks = [_task(manual, uuid4()), _task(manual, uuid4())]
+    review_repo.find_by_manual_id_with_entries.return_value = tasks
+
+    result = await service.get_review_tasks_by_manual_id(
+        manual.id, _user(UserRole.ADMIN, [])
+    )
+
+    review_repo.find_by_manual_id_with_entries.assert_awaited_once_with(
+        manual.id, reviewer_department_ids=None
+    )
+    assert [r.id for r in result] == [t.id for t in tasks]
@@ -1,11 +1,12 @@
 import pytest
+from datetime import datetime, timezone
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NeedsReReviewError
-from app.models.manual import ManualEntry, ManualStatus
+from app.models.manual import ManualEntry, ManualStatus, ManualVersion
 from app.models.task import ManualReviewTask, TaskStatus, ComparisonType
 from app.repositories.manual_rdb import (
     ManualEntryRDBRepository,
@@ -103,3 +104,70 @@ async def test_approve_guard_requires_rereview_when_candidate_changes():
 
     with pytest.raises(NeedsReReviewError):
         await service.approve_manual(manual.id, ManualApproveRequest(approver_id="rev1"))
+
+
+@pytest.mark.asyncio
+async def test_approve_guard_skipped_when_comparison_hash_matches():
+    manual = ManualEntry(
+        id=uuid4(),
+        keywords=["test"],
+        topic="Draft topic",
+        background="Background",
+        guideline="Guide",
+        business_type="결제",
+        error_code="E001",
+        source_consultation_id=uuid4(),
+        status=ManualStatus.DRAFT,
+    )
+    old_manual = ManualEntry(
+        id=uuid4(),
+        keywords=["test"],
+        topic="Existing",
+        background="Legacy",
+        guideline="Old guide",
+        business_type="결제",
+        error_code="E001",
+        source_consultation_id=uuid4(),
+        status=ManualStatus.APPROVED,
+    )
+    review_task = ManualReviewTask(
+        old_entry_id=old_manual.id,
+        new_entry_id=manual.id,
+        similarity=0.92,
+        comparison_type=ComparisonType.SUPPLEMENT,
+        status=TaskStatus.TODO,
+    )
+    review_task.id = uuid4()
+
+    manual_repo = AsyncMock(spec=ManualEntryRDBRepository)
+    review_repo = AsyncMock(spec=ManualReviewTaskRepository)
+    version_repo = AsyncMock(spec=ManualVersionRepository)
+    comparison_service = AsyncMock(spec=ComparisonService)
+
+    next_version = ManualVersion(id=uuid4(), version="1", business_type="결제", error_code="E001")
+    next_version.created_at = datetime.now(timezone.utc)
+
+    manual_repo.get_by_id.return_value = manual
+    manual_repo.find_all_approved_by_group.return_value = [old_manual]
+    manual_repo.mark_approved.return_value = manual
+    review_repo.get_latest_by_manual_id.return_value = review_task
+    version_repo.get_latest_version.return_value = None
+    version_repo.create_for_group.return_value = next_version
+
+    service = ManualService(
+        session=AsyncMock(spec=AsyncSession),
+        llm_client=DummyLLM(),
+        vectorstore=None,
+        manual_repo=manual_repo,
+        review_repo=review_repo,
+        version_repo=version_repo,
+        consultation_repo=AsyncMock(spec=ConsultationRepository),
+        common_code_item_repo=AsyncMock(spec=CommonCodeItemRepository),
+        comparison_service=comparison_service,
+    )
+    review_task.comparison_hash = service._comparison_hash(manual, [old_manual.id])
+
+    result = await service.approve_manual(manual.id, ManualApproveRequest(approver_id="rev1"))
+
+    assert result.version == "1"
+    comparison_service.find_best_match_candidate.assert_not_awaited()
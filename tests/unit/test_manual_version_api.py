@@ -33,6 +33,7 @@ class FakeManualRepository:
 
     def __init__(self):
         self._store: dict[UUID, ManualEntry] = {}
+        self.latest_lookups = 0
 
     async def get_by_id(self, manual_id: UUID) -> ManualEntry | None:
         return self._store.get(manual_id)
@@ -61,6 +62,20 @@ class FakeManualRepository:
             entries = [e for e in entries if e.status in statuses]
         return entries
 
+    async def find_by_group(
+        self, business_type: str, error_code: str, statuses=None
+    ) -> list[ManualEntry]:
+        return await self.find_by_business_and_error(business_type, error_code, statuses)
+
+    async def find_latest_by_group(
+        self, business_type: str, error_code: str, status=None
+    ) -> ManualEntry | None:
+        self.latest_lookups += 1
+        entries = await self.find_by_business_and_error(
+            business_type, error_code, {status} if status else None
+        )
+        return max(entries, key=lambda e: e.created_at, default=None)
+
     async def create(self, manual: ManualEntry) -> ManualEntry:
         self._store[manual.id] = manual
         return manual
@@ -110,6 +125,9 @@ class FakeVersionRepository:
         # Apply limit
         return versions[:limit]
 
+    async def get_by_ids(self, ids: list[UUID]) -> list[ManualVersion]:
+        return [v for v in self._store.values() if v.id in ids]
+
     async def create(self, version: ManualVersion) -> ManualVersion:
         self._store[version.id] = version
         self._version_map[version.version] = version.id
@@ -538,3 +556,28 @@ async def test_list_versions_multiple_groups_isolated(
     # 검증: 같은 그룹의 버전만 반환 (v2.1만)
     assert len(result) == 1
     assert result[0].value == "v2.1"
+
+
+@pytest.mark.asyncio
+async def test_get_manual_versions_by_group_looks_up_latest_once(
+    service,
+    manual_repo,
+    version_repo,
+    version_v2_1,
+    version_v2_0,
+    approved_manual_v2_1,
+    approved_manual_v2_0,
+):
+    """그룹 버전 목록: 최신 APPROVED 메뉴얼은 한 번만 조회"""
+    from datetime import timedelta
+
+    approved_manual_v2_0.created_at -= timedelta(days=1)
+    await version_repo.create(version_v2_1)
+    await version_repo.create(version_v2_0)
+    await manual_repo.create(approved_manual_v2_1)
+    await manual_repo.create(approved_manual_v2_0)
+
+    result = await service.get_manual_versions_by_group("인터넷뱅킹", "E001")
+
+    assert [r.label for r in result] == ["v2.1 (현재 버전)", "v2.0 (APPROVED)"]
+    assert manual_repo.latest_lookups == 1
@@ -218,6 +218,65 @@ async def test_repo_get_latest_version_with_group_filter(async_db_session: Async
     assert latest_b.version == "1"
 
 
+@pytest.mark.asyncio
+async def test_repo_get_by_ids_returns_requested_versions(async_db_session: AsyncSession):
+    """T2-1: 여러 버전을 ID 목록으로 한 번에 조회."""
+    repo = ManualVersionRepository(async_db_session)
+    now = datetime.now(timezone.utc)
+
+    versions = [
+        ManualVersion(
+            version=str(i),
+            business_type="인터넷뱅킹",
+            error_code="ERR_LOGIN_001",
+            created_at=now + timedelta(days=i),
+            updated_at=now + timedelta(days=i),
+        )
+        for i in range(1, 4)
+    ]
+    async_db_session.add_all(versions)
+    await async_db_session.flush()
+
+    found = await repo.get_by_ids([versions[0].id, versions[2].id])
+
+    assert {v.id for v in found} == {versions[0].id, versions[2].id}
+    assert await repo.get_by_ids([]) == []
+
+
+@pytest.mark.asyncio
+async def test_repo_get_by_versions_scoped_to_group(async_db_session: AsyncSession):
+    """T2-2: 여러 버전 문자열을 그룹 필터와 함께 한 번에 조회."""
+    repo = ManualVersionRepository(async_db_session)
+    now = datetime.now(timezone.utc)
+
+    async_db_session.add_all(
+        [
+            ManualVersion(
+                version=version,
+                business_type=business_type,
+                error_code=error_code,
+                created_at=now,
+                updated_at=now,
+            )
+            for version, business_type, error_code in [
+                ("1", "인터넷뱅킹", "ERR_LOGIN_001"),
+                ("2", "인터넷뱅킹", "ERR_LOGIN_001"),
+                ("1", "모바일뱅킹", "ERR_OTP_002"),
+            ]
+        ]
+    )
+    await async_db_session.flush()
+
+    found = await repo.get_by_versions(
+        ["1", "2", "3"],
+        business_type="인터넷뱅킹",
+        error_code="ERR_LOGIN_001",
+    )
+
+    assert set(found) == {"1", "2"}
+    assert all(v.business_type == "인터넷뱅킹" for v in found.values())
+
+
 @pytest.mark.asyncio
 async def test_service_approve_manual_assigns_group_version(
     async_db_session: AsyncSession, manual_service: ManualService
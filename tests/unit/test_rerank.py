@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+from app.services.rerank import rerank_results
+
+
+def test_rerank_applies_domain_and_recency_bonus_and_sorts():
+    now = datetime.now(timezone.utc)
+    results = [
+        {
+            "item": "old",
+            "score": 0.5,
+            "metadata": {"created_at": now - timedelta(days=365)},
+        },
+        {
+            "item": "match",
+            "score": 0.45,
+            "metadata": {
+                "business_type": "IB",
+                "error_code": "E1",
+                "created_at": now.isoformat(),
+            },
+        },
+        {"item": "plain", "score": 0.5, "metadata": None},
+    ]
+
+    reranked = rerank_results(
+        results,
+        domain_weight_config={"business_type": "IB", "error_code": "E1"},
+        recency_weight_config={"weight": 0.05, "half_life_days": 30},
+    )
+
+    assert [r["item"] for r in reranked] == ["match", "old", "plain"]
+    assert reranked[0]["domain_bonus"] == 0.1
+    assert abs(reranked[0]["recency_bonus"] - 0.05) < 1e-6
+    assert 0 < reranked[1]["recency_bonus"] < 0.01
+    assert reranked[2]["recency_bonus"] == 0.0
+
+
+def test_rerank_ignores_unparseable_created_at():
+    results = [
+        {"item": "bad", "score": 0.4, "metadata": {"created_at": "not-a-date"}},
+        {"item": "num", "score": 0.3, "metadata": {"created_at": 12345}},
+    ]
+
+    reranked = rerank_results(results)
+
+    assert [r["item"] for r in reranked] == ["bad", "num"]
+    assert all(r["recency_bonus"] == 0.0 for r in reranked)
+
+
+def test_recency_bonus_halves_every_half_life():
+    now = datetime.now(timezone.utc)
+    results = [
+        {
+            "item": age,
+            "score": 0.0,
+            "metadata": {"created_at": now - timedelta(days=age)},
+        }
+        for age in (0, 30, 60)
+    ]
+
+    reranked = rerank_results(
+        results, recency_weight_config={"weight": 0.08, "half_life_days": 30}
+    )
+
+    bonuses = {r["item"]: r["recency_bonus"] for r in reranked}
+    assert abs(bonuses[0] - 0.08) < 1e-6
+    assert abs(bonuses[30] - 0.04) < 1e-6
+    assert abs(bonuses[60] - 0.02) < 1e-6
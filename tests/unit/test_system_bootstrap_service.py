@@ -0,0 +1,155 @@
+"""
+Unit tests for SystemBootstrapService
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.security import hash_password, verify_password
+from app.models import Base
+from app.models.department import Department, UserDepartment
+from app.models.user import User, UserRole
+from app.services.system_bootstrap_service import SystemBootstrapService
+
+ADMIN_ID = "admin"
+ADMIN_PW = "new-admin-pw"
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """In-memory SQLite 세션 팩토리 (테스트마다 새 DB)."""
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def _seed_user(
+    session: AsyncSession,
+    *,
+    role: UserRole,
+    password: str,
+    department_codes: tuple[str, ...] = (),
+) -> None:
+    user = User(
+        employee_id=ADMIN_ID,
+        name="기존 관리자",
+        role=role,
+        password_hash=hash_password(password),
+        is_active=True,
+    )
+    session.add(user)
+    await session.flush()
+    for index, code in enumerate(department_codes):
+        department = Department(
+            department_code=code, department_name=code, is_active=True
+        )
+        session.add(department)
+        await session.flush()
+        session.add(
+            UserDepartment(
+                user_id=user.id, department_id=department.id, is_primary=index == 0
+            )
+        )
+    await session.commit()
+
+
+async def _bootstrap(session_factory) -> None:
+    async with session_factory() as session:
+        await SystemBootstrapService(session).ensure_system_admin(ADMIN_ID, ADMIN_PW)
+        await session.commit()
+
+
+async def _load_links(session_factory) -> tuple[User, dict[str, bool]]:
+    """관리자와 {부서코드: 주 부서 여부} 매핑을 반환."""
+
+    async with session_factory() as session:
+        user = (
+            await session.execute(select(User).where(User.employee_id == ADMIN_ID))
+        ).scalar_one()
+        rows = await session.execute(
+            select(Department.department_code, UserDepartment.is_primary)
+            .join(UserDepartment, UserDepartment.department_id == Department.id)
+            .where(UserDepartment.user_id == user.id)
+        )
+        return user, {code: is_primary for code, is_primary in rows.all()}
+
+
+@pytest.mark.asyncio
+async def test_existing_admin_with_role_and_password_change_keeps_links(
+    session_factory,
+):
+    async with session_factory() as session:
+        await _seed_user(
+            session,
+            role=UserRole.CONSULTANT,
+            password="old-pw",
+            department_codes=("CS01",),
+        )
+
+    await _bootstrap(session_factory)
+
+    user, links = await _load_links(session_factory)
+    assert user.role == UserRole.ADMIN
+    assert verify_password(ADMIN_PW, user.password_hash)
+    assert links == {"CS01": True, SystemBootstrapService.SYSTEM_DEPARTMENT_CODE: False}
+
+
+@pytest.mark.asyncio
+async def test_new_admin_is_created_with_primary_system_link(session_factory):
+    await _bootstrap(session_factory)
+
+    user, links = await _load_links(session_factory)
+    assert user.role == UserRole.ADMIN
+    assert links == {SystemBootstrapService.SYSTEM_DEPARTMENT_CODE: True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("department_codes", "expected_links"),
+    [
+        ((), {SystemBootstrapService.SYSTEM_DEPARTMENT_CODE: True}),
+        (
+            ("CS01",),
+            {"CS01": True, SystemBootstrapService.SYSTEM_DEPARTMENT_CODE: False},
+        ),
+    ],
+)
+async def test_existing_admin_without_system_link_gets_linked(
+    session_factory, department_codes, expected_links
+):
+    async with session_factory() as session:
+        await _seed_user(
+            session,
+            role=UserRole.ADMIN,
+            password=ADMIN_PW,
+            department_codes=department_codes,
+        )
+
+    await _bootstrap(session_factory)
+
+    _, links = await _load_links(session_factory)
+    assert links == expected_links
+
+
+@pytest.mark.asyncio
+async def test_existing_admin_already_linked_is_left_unchanged(session_factory):
+    async with session_factory() as session:
+        await _seed_user(
+            session,
+            role=UserRole.ADMIN,
+            password=ADMIN_PW,
+            department_codes=(SystemBootstrapService.SYSTEM_DEPARTMENT_CODE,),
+        )
+
+    await _bootstrap(session_factory)
+    await _bootstrap(session_factory)
+
+    _, links = await _load_links(session_factory)
+    assert links == {SystemBootstrapService.SYSTEM_DEPARTMENT_CODE: True}
@@ -0,0 +1,137 @@
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.common_code_cache as common_code_cache
+from app.models.manual import ManualEntry
+from app.models.task import ManualReviewTask, TaskStatus
+from app.models.user import UserRole
+from app.repositories.common_code_rdb import CommonCodeItemRepository
+from app.repositories.manual_rdb import (
+    ManualEntryRDBRepository,
+    ManualReviewTaskRepository,
+)
+from app.schemas.manual import ManualReviewBulkApproval
+from app.services.manual_service import ManualService
+from app.services.task_service import TaskService
+
+
+def _manual(business_type: str = "IB"):
+    return ManualEntry(
+        id=uuid4(),
+        business_type=business_type,
+        error_code="E001",
+        topic="로그인 오류",
+        keywords=["로그인"],
+        background="배경",
+        guideline="가이드",
+    )
+
+
+def _task(old_entry_id, new_entry_id):
+    now = datetime.now(timezone.utc)
+    return ManualReviewTask(
+        id=uuid4(),
+        created_at=now,
+        updated_at=now,
+        old_entry_id=old_entry_id,
+        new_entry_id=new_entry_id,
+        similarity=0.9,
+        status=TaskStatus.TODO,
+        reviewer_id=None,
+        reviewer_department_id=None,
+        review_notes=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_to_responses_batches_manual_and_business_type_lookups(monkeypatch):
+    monkeypatch.setattr(common_code_cache, "_common_code_maps", {})
+    manuals = [_manual() for _ in range(4)]
+    tasks = [
+        _task(manuals[0].id, manuals[1].id),
+        _task(manuals[2].id, manuals[3].id),
+        _task(None, manuals[1].id),
+    ]
+
+    manual_repo = AsyncMock(spec=ManualEntryRDBRepository)
+    manual_repo.find_by_ids.return_value = manuals
+    common_code_repo = AsyncMock(spec=CommonCodeItemRepository)
+    common_code_repo.get_by_group_code.return_value = [
+        SimpleNamespace(code_key="IB", code_value="인터넷뱅킹")
+    ]
+
+    service = TaskService(
+        session=AsyncMock(spec=AsyncSession),
+        manual_service=MagicMock(spec=ManualService),
+        task_repo=AsyncMock(spec=ManualReviewTaskRepository),
+        manual_repo=manual_repo,
+        common_code_item_repo=common_code_repo,
+    )
+
+    responses = await service._to_responses(tasks)
+
+    assert [r.id for r in responses] == [t.id for t in tasks]
+    assert responses[2].old_manual_summary is None
+    assert all(r.business_type_name == "인터넷뱅킹" for r in responses)
+    manual_repo.find_by_ids.assert_awaited_once()
+    assert set(manual_repo.find_by_ids.await_args.args[0]) == {m.id for m in manuals}
+    manual_repo.get_by_id.assert_not_awaited()
+    common_code_repo.get_by_group_code.assert_awaited_once_with(
+        "BUSINESS_TYPE", is_active_only=True
+    )
+
+    # 캐시된 BUSINESS_TYPE 매핑은 다시 조회하지 않음
+    await service._to_responses(tasks[:1])
+    common_code_repo.get_by_group_code.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_records_history_with_single_flush(monkeypatch):
+    monkeypatch.setattr(common_code_cache, "_common_code_maps", {})
+
+    manuals = [_manual() for _ in range(2)]
+    tasks = [_task(None, manual.id) for manual in manuals]
+
+    session = AsyncMock(spec=AsyncSession)
+    session.add_all = MagicMock()
+    task_repo = AsyncMock(spec=ManualReviewTaskRepository)
+    task_repo.find_by_ids.return_value = list(reversed(tasks))
+    manual_repo = AsyncMock(spec=ManualEntryRDBRepository)
+    manual_repo.find_by_ids.return_value = manuals
+    common_code_repo = AsyncMock(spec=CommonCodeItemRepository)
+    common_code_repo.get_by_group_code.return_value = []
+    manual_service = AsyncMock(spec=ManualService)
+
+    service = TaskService(
+        session=session,
+        manual_service=manual_service,
+        task_repo=task_repo,
+        manual_repo=manual_repo,
+        common_code_item_repo=common_code_repo,
+    )
+    admin = MagicMock()
+    admin.role = UserRole.ADMIN
+
+    responses = await service.bulk_approve_tasks(
+        ManualReviewBulkApproval(
+            task_ids=[task.id for task in tasks],
+            employee_id="reviewer-001",
+            review_notes="일괄 승인",
+        ),
+        current_user=admin,
+    )
+
+    assert [r.id for r in responses] == [task.id for task in tasks]
+    assert all(r.status == TaskStatus.DONE for r in responses)
+    histories = session.add_all.call_args.args[0]
+    assert [h.task_id for h in histories] == [task.id for task in tasks]
+    assert all(h.from_status == TaskStatus.TODO for h in histories)
+    session.flush.assert_awaited_once()
+    task_repo.update.assert_not_awaited()
+    assert len({task.updated_at for task in tasks}) == 1
+    assert manual_service.approve_manual.await_count == 2
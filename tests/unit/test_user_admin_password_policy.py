@@ -39,3 +39,8 @@ async def test_password_policy_accepts_valid_password(admin_service):
 async def test_password_policy_rejects_invalid_passwords(admin_service, password):
     with pytest.raises(ValidationError):
         await admin_service._enforce_password_policy(password)
+
+
+@pytest.mark.asyncio
+async def test_password_policy_treats_non_ascii_as_special(admin_service):
+    await admin_service._enforce_password_policy("StrongPassword한글")
@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.models.department import Department, UserDepartment
+from app.models.user import User, UserRole
+from app.schemas.user import UserResponse
+from app.services.user_admin_service import _to_user_response
+
+
+def test_list_user_response_matches_validated_response():
+    now = datetime.now(timezone.utc)
+    department = Department(
+        id=uuid4(),
+        department_code="D001",
+        department_name="고객지원",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    user = User(
+        id=1,
+        employee_id="E001",
+        name="홍길동",
+        role=UserRole.REVIEWER,
+        password_hash="hashed",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    user.department_links = [
+        UserDepartment(
+            department=department, department_id=department.id, is_primary=True
+        )
+    ]
+
+    assert _to_user_response(user) == UserResponse.model_validate(user)
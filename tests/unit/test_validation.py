@@ -0,0 +1,26 @@
+from app.services.validation import (
+    validate_keywords_in_source,
+    validate_sentences_subset_of_source,
+)
+
+
+def test_validate_keywords_uses_case_insensitive_substring_match():
+    source = "인터넷뱅킹 로그인오류가 발생했습니다. OTP 재발급 후 해결"
+
+    ok, missing = validate_keywords_in_source(
+        ["로그인", "otp", "OTP", "", "비밀번호"], source
+    )
+
+    assert ok is False
+    assert missing == ["비밀번호"]
+
+
+def test_validate_sentences_subset_of_source_reports_missing_sentences():
+    source = "고객이 로그인 실패를 문의함. 비밀번호 초기화 안내."
+
+    ok, missing = validate_sentences_subset_of_source(
+        "비밀번호 초기화 안내. 앱 재설치 안내", source
+    )
+
+    assert ok is False
+    assert missing == ["앱 재설치 안내"]